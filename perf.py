@@ -58,6 +58,51 @@ else:
     def cht(s):
         pass
 
+if '--import' in sys.argv:
+    import subprocess
+    times = []
+    for i in range(20):
+        out = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import pygal'],
+            capture_output=True, text=True, check=True).stderr
+        times.append(int(out.strip().splitlines()[-1].split('|')[1]))
+    print('import pygal: %.1fms (best of 20)' % (min(times) / 1000))
+    sys.exit(0)
+
+if '--interpolate' in sys.argv:
+    from pygal.columns import _numpy
+    from pygal.interpolate import INTERPOLATIONS, VECTORIZED_INTERPOLATIONS
+    numpy = _numpy()
+    for kind, length in (
+            ('quadratic', 2000), ('cubic', 2000), ('hermite', 2000),
+            ('lagrange', 20), ('trigonometric', 20)):
+        x = list(range(length))
+        y = [rands[i % 1000][1] for i in range(length)]
+        python = min(timeit.repeat(
+            lambda: list(INTERPOLATIONS[kind](x, y)), number=1, repeat=3))
+        vectorized = min(timeit.repeat(
+            lambda: VECTORIZED_INTERPOLATIONS[kind](x, y, 250, numpy),
+            number=1, repeat=3))
+        print('%s (%d points):\tpython %.3fs\tnumpy %.3fs\tx%.1f' % (
+            kind, length, python, vectorized, python / vectorized))
+    sys.exit(0)
+
+if '--log' in sys.argv:
+    from pygal import Line
+    times = []
+    for length in (10000, 20000):
+        chart = Line(logarithmic=True, show_dots=False)
+        chart.add('latency', [
+            rands[i % 1000][0] - 10 for i in range(length)
+        ])
+        times.append(min(timeit.repeat(chart.render, number=1, repeat=3)))
+        print('logarithmic line (%d values):\t%.3fs' % (length, times[-1]))
+    # Twice the values must take about twice the time
+    if times[1] > 3 * times[0]:
+        print('Logarithmic line rendering is not linear')
+        sys.exit(1)
+    sys.exit(0)
+
 if '--profile' in sys.argv:
     import cProfile
     c = perf('Line', 500, 500)
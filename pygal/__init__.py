@@ -26,60 +26,112 @@ and the maps extensions namespace module.
 from .__about__ import *  # noqa: F401,F403 isort: skip
 
 import sys
-import traceback
-import warnings
+from importlib import import_module
 
-from importlib_metadata import entry_points
+from pygal import maps
+from pygal.config import Config
 
+# Charts are imported on first access (see __getattr__)
 # All the commented lines are used for different visualizations which are not a part of this repository at present.
 # Please uncomment them if you want to add customizations to those in the future.
-from pygal import maps
-from pygal.config import Config
-from pygal.graph.bar import Bar
-# from pygal.graph.box import Box
-# from pygal.graph.dot import Dot
-# from pygal.graph.funnel import Funnel
-# from pygal.graph.gauge import Gauge
-from pygal.graph.graph import Graph
-from pygal.graph.histogram import Histogram
-# from pygal.graph.horizontalbar import HorizontalBar
-# from pygal.graph.horizontalline import HorizontalLine
-# from pygal.graph.horizontalstackedbar import HorizontalStackedBar
-# from pygal.graph.horizontalstackedline import HorizontalStackedLine
-from pygal.graph.line import Line
-from pygal.graph.pie import Pie
-# from pygal.graph.pyramid import Pyramid, VerticalPyramid
-# from pygal.graph.radar import Radar
-from pygal.graph.solidgauge import SolidGauge
-from pygal.graph.stackedbar import StackedBar
-# from pygal.graph.stackedline import StackedLine
-# from pygal.graph.time import DateLine, DateTimeLine, TimeDeltaLine, TimeLine
-# from pygal.graph.treemap import Treemap
-from pygal.graph.xy import XY
-
-CHARTS_BY_NAME = dict([
-    (k, v) for k, v in locals().items()
-    if isinstance(v, type) and issubclass(v, Graph) and v != Graph
-])
-
-from pygal.graph.map import BaseMap
-
-for entry in entry_points(group="pygal.maps"):
-    try:
-        module = entry.load()
-    except Exception:
-        warnings.warn(
-            'Unable to load %s pygal plugin \n\n%s' %
-            (entry, traceback.format_exc()), Warning
-        )
-        continue
-    setattr(maps, entry.name, module)
-    for k, v in module.__dict__.items():
-        if isinstance(v, type) and issubclass(v, BaseMap) and v != BaseMap:
-            CHARTS_BY_NAME[entry.name.capitalize() + k + 'Map'] = v
-
-CHARTS_NAMES = list(CHARTS_BY_NAME.keys())
-CHARTS = list(CHARTS_BY_NAME.values())
+_CHART_MODULES = {
+    'Bar': 'pygal.graph.bar',
+    # 'Box': 'pygal.graph.box',
+    # 'Dot': 'pygal.graph.dot',
+    # 'Funnel': 'pygal.graph.funnel',
+    # 'Gauge': 'pygal.graph.gauge',
+    'Histogram': 'pygal.graph.histogram',
+    # 'HorizontalBar': 'pygal.graph.horizontalbar',
+    # 'HorizontalLine': 'pygal.graph.horizontalline',
+    # 'HorizontalStackedBar': 'pygal.graph.horizontalstackedbar',
+    # 'HorizontalStackedLine': 'pygal.graph.horizontalstackedline',
+    'Line': 'pygal.graph.line',
+    'Pie': 'pygal.graph.pie',
+    # 'Pyramid': 'pygal.graph.pyramid',
+    # 'VerticalPyramid': 'pygal.graph.pyramid',
+    # 'Radar': 'pygal.graph.radar',
+    'SolidGauge': 'pygal.graph.solidgauge',
+    'StackedBar': 'pygal.graph.stackedbar',
+    # 'StackedLine': 'pygal.graph.stackedline',
+    # 'DateLine': 'pygal.graph.time',
+    # 'DateTimeLine': 'pygal.graph.time',
+    # 'TimeDeltaLine': 'pygal.graph.time',
+    # 'TimeLine': 'pygal.graph.time',
+    # 'Treemap': 'pygal.graph.treemap',
+    'XY': 'pygal.graph.xy',
+}
+
+_LAZY_MODULES = dict(
+    _CHART_MODULES,
+    Graph='pygal.graph.graph',
+    render_page='pygal.page',
+    render_many='pygal.parallel',
+)
+
+_plugins_loaded = False
+
+
+def load_plugins():
+    """
+    Load the map plugins declared in the ``pygal.maps`` entry points
+    (done once, on first access to the charts list or to a plugin)
+    """
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+
+    import traceback
+    import warnings
+
+    from importlib_metadata import entry_points
+
+    from pygal.graph.map import BaseMap
+
+    charts = dict(
+        (name, getattr(sys.modules[__name__], name))
+        for name in _CHART_MODULES
+    )
+    for entry in entry_points(group="pygal.maps"):
+        try:
+            module = entry.load()
+        except Exception:
+            warnings.warn(
+                'Unable to load %s pygal plugin \n\n%s' %
+                (entry, traceback.format_exc()), Warning
+            )
+            continue
+        setattr(maps, entry.name, module)
+        for k, v in module.__dict__.items():
+            if (isinstance(v, type) and issubclass(v, BaseMap)
+                    and v != BaseMap):
+                charts[entry.name.capitalize() + k + 'Map'] = v
+
+    global CHARTS_BY_NAME, CHARTS_NAMES, CHARTS
+    CHARTS_BY_NAME = charts
+    CHARTS_NAMES = list(CHARTS_BY_NAME.keys())
+    CHARTS = list(CHARTS_BY_NAME.values())
+    # Only now, to load them again on next access if something failed
+    _plugins_loaded = True
+
+
+def __getattr__(name):
+    """Import charts and load the map plugins when they are first used"""
+    if name in _LAZY_MODULES:
+        value = getattr(import_module(_LAZY_MODULES[name]), name)
+        globals()[name] = value
+        return value
+    if name in ('CHARTS_BY_NAME', 'CHARTS_NAMES', 'CHARTS'):
+        load_plugins()
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    """List the lazy attributes too"""
+    return sorted(
+        set(globals()) | set(_LAZY_MODULES)
+        | {'CHARTS_BY_NAME', 'CHARTS_NAMES', 'CHARTS'}
+    )
 
 
 class PluginImportFixer(object):
@@ -95,8 +147,10 @@ class PluginImportFixer(object):
         the load_module function, ie: if it is a ``pygal.maps.*``
         module.
         """
-        if fullname.startswith('pygal.maps.') and hasattr(
-                maps, fullname.split('.')[2]):
+        if not fullname.startswith('pygal.maps.'):
+            return None
+        load_plugins()
+        if hasattr(maps, fullname.split('.')[2]):
             return self
         return None
 
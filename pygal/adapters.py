@@ -18,6 +18,9 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Value adapters to use when a chart doesn't accept all value types"""
 from decimal import Decimal
+from itertools import chain
+
+from pygal.util import ident
 
 
 def positive(x):
@@ -50,3 +53,70 @@ def decimal_to_float(x):
     if isinstance(x, Decimal):
         return float(x)
     return x
+
+
+# Adapters leaving int and float values unchanged
+NUMBERS_KEPT = {ident, none_to_zero, decimal_to_float}
+# Adapters leaving positive int and float values unchanged
+POSITIVE_NUMBERS_KEPT = NUMBERS_KEPT | {positive, not_zero}
+_numbers = {int, float}
+
+
+def compile_adapters(adapters):
+    """
+    Compose the adapters in a single function applying them from the last
+    to the first like `reduce(compose, adapters)`
+    """
+    adapters = [
+        adapter for adapter in reversed(adapters) if adapter is not ident
+    ]
+    if not adapters:
+        return ident
+    if len(adapters) == 1:
+        return adapters[0]
+
+    def adapt(x):
+        for adapter in adapters:
+            x = adapter(x)
+        return x
+
+    return adapt
+
+
+def numbers_adapter(adapters, size=None):
+    """
+    Return a function adapting at once the list of values of a serie
+    made only of int and float values (of list-like values of `size`
+    int and float values when size is given) or returning None
+    when they must be adapted one by one.
+    Return None if the adapters don't keep all these values unchanged.
+    """
+    if size is not None:
+        if not all(adapter in NUMBERS_KEPT for adapter in adapters):
+            return
+
+        def adapt_tuples(values):
+            if (set(map(type, values)) <= {tuple, list}
+                    and set(map(len, values)) == {size} and
+                    set(map(type, chain.from_iterable(values))) <= _numbers):
+                return [list(value) for value in values]
+
+        return adapt_tuples
+
+    if all(adapter in NUMBERS_KEPT for adapter in adapters):
+
+        def adapt_numbers(values):
+            if set(map(type, values)) <= _numbers:
+                return list(values)
+
+        return adapt_numbers
+
+    if all(adapter in POSITIVE_NUMBERS_KEPT for adapter in adapters):
+        adapt = compile_adapters(adapters)
+
+        def adapt_positive_numbers(values):
+            if set(map(type, values)) <= _numbers:
+                return [value if value > 0 else adapt(value)
+                        for value in values]
+
+        return adapt_positive_numbers
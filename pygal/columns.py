@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""
+Typed columns support: numpy arrays, array.array and buffer protocol
+objects given as serie values are kept as is and converted at once.
+
+Missing values are NaN in float columns and the chart adapters are applied
+as vectorized operations when numpy is available.
+"""
+
+import sys
+from array import array
+
+from pygal.adapters import decimal_to_float, none_to_zero, not_zero, positive
+from pygal.util import ident
+
+NUMERIC_KINDS = 'fiu'
+
+
+def _numpy():
+    """Return the numpy module if it can be imported, None otherwise"""
+    numpy = sys.modules.get('numpy')
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+    return numpy
+
+
+def is_column(values):
+    """Return whether values is a numpy array or a buffer of numbers"""
+    if isinstance(values, (array, memoryview)):
+        return True
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return True
+    # Any other object implementing the buffer protocol
+    if isinstance(values, (bytes, bytearray, str)):
+        return False
+    try:
+        memoryview(values)
+    except TypeError:
+        return False
+    return True
+
+
+def as_column(values):
+    """
+    Wrap values as a typed column without copying them:
+    a numpy array when numpy is available, a memoryview otherwise
+    """
+    numpy = _numpy()
+    if numpy is not None:
+        values = numpy.asarray(values)
+        if values.ndim == 0:
+            return [values.tolist()]
+        if values.dtype.kind in NUMERIC_KINDS:
+            return values
+        return values.tolist()
+    values = memoryview(values)
+    if values.ndim == 0:
+        return [values.tolist()]
+    if values.format.lstrip('@=<>!') in tuple('bBhHiIlLqQnNfd'):
+        return values
+    return values.tolist()
+
+
+def _positive(column, missing, zeroed, numpy):
+    """Vectorized `adapters.positive`"""
+    negative = (column < 0) & ~missing
+    return numpy.where(negative, 0, column), missing, zeroed | negative
+
+
+def _not_zero(column, missing, zeroed, numpy):
+    """Vectorized `adapters.not_zero`"""
+    zero = (column == 0) & ~missing
+    return column, missing | zero, zeroed & ~zero
+
+
+def _none_to_zero(column, missing, zeroed, numpy):
+    """Vectorized `adapters.none_to_zero`"""
+    return numpy.where(missing, 0, column), missing & False, zeroed | missing
+
+
+def _ident(column, missing, zeroed, numpy):
+    """Numbers are left untouched by these adapters"""
+    return column, missing, zeroed
+
+
+VECTORIZED_ADAPTERS = {
+    positive: _positive,
+    not_zero: _not_zero,
+    none_to_zero: _none_to_zero,
+    decimal_to_float: _ident,
+    ident: _ident,
+}
+
+
+def _nan_to_none(values):
+    """Replace NaN by None in a (possibly nested) list of floats"""
+    return [
+        None if value != value else
+        _nan_to_none(value) if isinstance(value, list) else value
+        for value in values
+    ]
+
+
+def column_to_list(column, adapters=()):
+    """
+    Convert a column into a list of values with None for missing ones,
+    applying the given adapters (in application order) on the way.
+
+    Like the adapters, values set to zero or None are int 0 and None.
+    Return the list and the adapters that could not be vectorized
+    and must still be applied on each value.
+    """
+    numpy = sys.modules.get('numpy')
+    if numpy is None or not isinstance(column, numpy.ndarray):
+        values = column.tolist()
+        if column.format.lstrip('@=<>!') in ('f', 'd'):
+            values = _nan_to_none(values)
+        return values, list(adapters)
+
+    if column.dtype.kind == 'f':
+        missing = numpy.isnan(column)
+    else:
+        missing = numpy.zeros(column.shape, dtype=bool)
+    zeroed = numpy.zeros(column.shape, dtype=bool)
+
+    adapters = list(adapters)
+    while adapters and adapters[0] in VECTORIZED_ADAPTERS:
+        column, missing, zeroed = VECTORIZED_ADAPTERS[adapters.pop(0)](
+            column, missing, zeroed, numpy
+        )
+
+    values = column.tolist()
+    for value, mask in ((None, missing), (0, zeroed)):
+        for index in numpy.argwhere(mask).tolist():
+            row = values
+            for i in index[:-1]:
+                row = row[i]
+            row[index[-1]] = value
+    return values, adapters
@@ -21,6 +21,7 @@
 from copy import deepcopy
 
 from pygal import formatters
+from pygal.decimate import DECIMATIONS
 from pygal.interpolate import INTERPOLATIONS
 from pygal.style import DefaultStyle, Style
 
@@ -73,6 +74,15 @@ class Key(object):
             (' %s' % self.subdoc) if self.subdoc else ''
         )
 
+    def __get__(self, instance, owner):
+        """
+        Return the key on the config class and its default value on
+        config instances which don't override it
+        """
+        if instance is None:
+            return self
+        return instance._default(self.name)
+
     @property
     def is_boolean(self):
         """Return `True` if this parameter is a boolean"""
@@ -120,16 +130,77 @@ class Key(object):
         return self.type(value)
 
 
+class Default(object):
+    """A config key default value overriden by a config class"""
+
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value):
+        """Create the default value of the key name"""
+        self.name = name
+        self.value = value
+
+    def __get__(self, instance, owner):
+        """Return the value (as it was when instance was created)"""
+        if instance is None:
+            return self.value
+        return instance._default(self.name)
+
+
 class MetaConfig(type):
-    """Config metaclass. Used to get the key name and set it on the value."""
+    """
+    Config metaclass. Used to get the key name and set it on the value.
+
+    It also computes once the default values of the config class. They are
+    replaced, never updated, when the class is changed so that config
+    instances keep the defaults they were created with.
+    """
 
     def __new__(mcs, classname, bases, classdict):
         """Get the name of the key and set it on the key"""
+        keys = set()
+        for base in bases:
+            keys.update(getattr(base, '_keys', ()))
         for k, v in classdict.items():
             if isinstance(v, Key):
                 v.name = k
-
-        return type.__new__(mcs, classname, bases, classdict)
+                keys.add(k)
+        for k, v in list(classdict.items()):
+            if k in keys and not isinstance(v, Key):
+                classdict[k] = Default(k, v)
+        classdict['_keys'] = frozenset(keys)
+
+        cls = type.__new__(mcs, classname, bases, classdict)
+        cls._set_defaults()
+        return cls
+
+    def __setattr__(cls, name, value):
+        """Change a config class default value"""
+        if name in cls._keys and not isinstance(value, Key):
+            value = Default(name, value)
+        super(MetaConfig, cls).__setattr__(name, value)
+        if not name.startswith('_'):
+            cls._set_defaults()
+
+    def _set_defaults(cls):
+        """Compute the default values of this class and its subclasses"""
+        # Names which can be set by kwargs
+        cls._options = frozenset(k for k in dir(cls) if not k.startswith('_'))
+        defaults = {}
+        for k in cls._options:
+            v = cls.__dict__.get(k)
+            if v is None:
+                v = getattr(cls, k)
+            if isinstance(v, Key) and v.is_list and v.value is not None:
+                v = list(v.value)
+            elif isinstance(v, (Key, Default)):
+                v = v.value
+            elif k not in cls._keys and hasattr(v, '__call__'):
+                continue
+            defaults[k] = v
+        cls._defaults = defaults
+        for subclass in cls.__subclasses__():
+            subclass._set_defaults()
 
 
 class BaseConfig(MetaConfig('ConfigBase', (object, ), {})):
@@ -140,39 +211,45 @@ class BaseConfig(MetaConfig('ConfigBase', (object, ), {})):
     updated on call with keyword arguments.
     """
 
+    __slots__ = ('_base', )
+
     def __init__(self, **kwargs):
-        """Can be instanciated with config kwargs"""
-        for k in dir(self):
-            v = getattr(self, k)
-            if (k not in self.__dict__ and not k.startswith('_')
-                    and not hasattr(v, '__call__')):
-                if isinstance(v, Key):
-                    if v.is_list and v.value is not None:
-                        v = list(v.value)
-                    else:
-                        v = v.value
-                setattr(self, k, v)
+        """
+        Can be instanciated with config kwargs.
+        Only the given values are stored, the others are read
+        in the class defaults.
+        """
+        self._base = self._defaults
         self._update(kwargs)
 
+    def _default(self, name):
+        """Get the default value of a key, copying list defaults"""
+        value = self._base[name]
+        if isinstance(value, list):
+            value = self.__dict__[name] = list(value)
+        return value
+
     def __call__(self, **kwargs):
         """Can be updated with kwargs"""
         self._update(kwargs)
 
     def _update(self, kwargs):
         """Update the config with the given dictionary"""
-        from pygal.util import merge
-        dir_self_set = set(dir(self))
-        merge(
-            self.__dict__,
-            dict([(k, v) for (k, v) in kwargs.items()
-                  if not k.startswith('_') and k in dir_self_set])
-        )
+        from pygal.util import list_keys, mergextend
+        for k, v in kwargs.items():
+            if k not in self._options:
+                continue
+            if isinstance(v, Key):
+                v = v.value
+            if k in list_keys():
+                v = mergextend(v, getattr(self, k, ()))
+            self.__dict__[k] = v
 
     def to_dict(self):
         """Export a JSON serializable dictionary of the config"""
         config = {}
         for attr in dir(self):
-            if not attr.startswith('__'):
+            if not attr.startswith('_'):
                 value = getattr(self, attr)
                 if hasattr(value, 'to_dict'):
                     config[attr] = value.to_dict()
@@ -181,8 +258,11 @@ class BaseConfig(MetaConfig('ConfigBase', (object, ), {})):
         return config
 
     def copy(self):
-        """Copy this config object into another"""
-        return deepcopy(self)
+        """Copy this config object (only its own values) into another"""
+        config = self.__class__.__new__(self.__class__)
+        config._base = self._base
+        config.__dict__ = deepcopy(self.__dict__)
+        return config
 
 
 class CommonConfig(BaseConfig):
@@ -330,6 +410,12 @@ class Config(CommonConfig):
         "Leave it to None to disable x labels display.", str
     )
 
+    extend_x_labels = Key(
+        False, bool, "Label",
+        "Add the keys of dict series missing from x_labels to x_labels",
+        "Otherwise their values are ignored with a warning"
+    )
+
     x_labels_major = Key(
         None,
         list,
@@ -419,12 +505,27 @@ class Config(CommonConfig):
         250, int, "Value", "Number of interpolated points between two values"
     )
 
+    interpolation_density = Key(
+        None, float, "Value",
+        "Number of interpolated points per pixel of chart width",
+        "When set, the interpolated points are distributed between the "
+        "values by the length of each segment on the chart instead of "
+        "using interpolation_precision. It only caps the number of points "
+        "at the chart width (margins included) times the density"
+    )
+
     interpolation_parameters = Key(
         {}, dict, "Value", "Various parameters for parametric interpolations",
         "ie: For hermite interpolation, you can set the cardinal tension with"
         "{'type': 'cardinal', 'c': .5}", int
     )
 
+    decimate = Key(
+        None, str, "Value", "Decimation of big line series",
+        "Only draw a few points per pixel. May be %s" %
+        ' or '.join(DECIMATIONS)
+    )
+
     box_mode = Key(
         'extremes', str, "Value", "Sets the mode to be used. "
         "(Currently only supported on box plot)", "May be %s" %
@@ -520,12 +621,31 @@ class Config(CommonConfig):
 
     pretty_print = Key(False, bool, "Misc", "Pretty print the svg")
 
+    coordinate_precision = Key(
+        None, int, "Misc", "Number of decimals of the svg coordinates",
+        "Lower precision makes smaller svg. "
+        "None keeps 6 decimals in paths and full precision elsewhere"
+    )
+
+    relative_paths = Key(
+        False, bool, "Misc", "Write lines as relative paths",
+        "Relative coordinates are shorter, mostly with a low "
+        "coordinate_precision"
+    )
+
     strict = Key(
         False, bool, "Misc", "If True don't try to adapt / filter wrong values"
     )
 
     no_prefix = Key(False, bool, "Misc", "Don't prefix css")
 
+    shared_assets = Key(
+        False, bool, "Misc", "Don't include the css and js in the chart",
+        "The css is then prefixed by a class shared by all the charts "
+        "having the same style. Used by pygal.render_page to write the css "
+        "and js once for many charts."
+    )
+
     inverse_y_axis = Key(False, bool, "Misc", "Inverse Y axis direction")
 
 
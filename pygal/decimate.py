@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""
+Decimation functions
+
+These functions take a list of projected points (x, y) and the start and
+stop index of a run of points without None and return the sorted indexes
+of the points to draw so that there are only a few points per pixel.
+Points are expected to be sorted along x, `decimate` sorts the runs
+which are not.
+
+"""
+from __future__ import division
+
+from math import floor
+
+
+def lttb_decimate(points, start, stop):
+    """
+    Keep one point per pixel using the Largest Triangle Three Buckets
+    algorithm: https://skemman.is/handle/1946/15343
+    """
+    n = stop - start
+    threshold = int(abs(points[stop - 1][0] - points[start][0])) + 2
+    if threshold < 3 or threshold >= n:
+        return list(range(start, stop))
+
+    every = (n - 2) / (threshold - 2)
+    a = start
+    kept = [start]
+    for i in range(threshold - 2):
+        # Average of the next bucket
+        avg_start = start + int((i + 1) * every) + 1
+        avg_stop = min(start + int((i + 2) * every) + 1, stop)
+        avg_x = avg_y = 0
+        for x, y in points[avg_start:avg_stop]:
+            avg_x += x
+            avg_y += y
+        avg_len = avg_stop - avg_start
+        avg_x /= avg_len
+        avg_y /= avg_len
+
+        ax, ay = points[a]
+        max_area = -1
+        for j in range(start + int(i * every) + 1, avg_start):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                a = j
+        kept.append(a)
+    kept.append(stop - 1)
+    return kept
+
+
+def _pixel_buckets(points, start, stop):
+    """
+    Yield the (first, low, high, last) indexes of the consecutive
+    points falling in the same pixel column
+    """
+    if start >= stop:
+        return
+    x, low_y = points[start]
+    high_y = low_y
+    column = floor(x)
+    first = low = high = last = start
+    for i in range(start + 1, stop):
+        x, y = points[i]
+        c = floor(x)
+        if c != column:
+            yield first, low, high, last
+            column = c
+            first = low = high = last = i
+            low_y = high_y = y
+        else:
+            last = i
+            if y < low_y:
+                low, low_y = i, y
+            elif y > high_y:
+                high, high_y = i, y
+    yield first, low, high, last
+
+
+def m4_decimate(points, start, stop):
+    """
+    Keep the first, last, lowest and highest points of each pixel column
+    which draws the exact same line as all the points: M4 algorithm
+    http://www.vldb.org/pvldb/vol7/p797-jugel.pdf
+    """
+    kept = []
+    for bucket in _pixel_buckets(points, start, stop):
+        kept.extend(sorted(set(bucket)))
+    return kept
+
+
+def min_max_decimate(points, start, stop):
+    """Keep the lowest and highest points of each pixel column"""
+    kept = set((start, stop - 1))
+    for first, low, high, last in _pixel_buckets(points, start, stop):
+        kept.add(low)
+        kept.add(high)
+    return sorted(kept)
+
+
+DECIMATIONS = {
+    'lttb': lttb_decimate,
+    'm4': m4_decimate,
+    'min_max': min_max_decimate
+}
+
+
+def _decimate_run(decimation, points, start, stop):
+    """Decimate a run of points in x order"""
+    if all(points[i][0] <= points[i + 1][0] for i in range(start, stop - 1)):
+        return decimation(points, start, stop)
+    order = sorted(range(start, stop), key=lambda i: points[i][0])
+    return [
+        order[i]
+        for i in decimation([points[i] for i in order], 0, len(order))
+    ]
+
+
+def decimate(points, method):
+    """
+    Return the indexes of the points to draw with the given decimation
+    method. Points with a None coordinate are always kept, the points
+    between them are drawn in x order.
+    """
+    if method not in DECIMATIONS:
+        raise ValueError(
+            "Invalid value ({}) for config key 'decimate';"
+            " Use None, 'lttb', 'm4' or 'min_max'".format(method)
+        )
+    decimation = DECIMATIONS[method]
+    kept = []
+    start = None
+    for i, (x, y) in enumerate(points + [(None, None)]):
+        if x is None or y is None:
+            if start is not None:
+                kept.extend(_decimate_run(decimation, points, start, i))
+                start = None
+            if i < len(points):
+                kept.append(i)
+        elif start is None:
+            start = i
+    return kept
@@ -1,6 +1,8 @@
 import math
+from itertools import accumulate
+
 from pygal.graph.graph import Graph
-from pygal.util import alter, decorate, ident, swap
+from pygal.util import alter, cached_property, decorate, ident, swap
 
 
 class Bar(Graph):
@@ -19,10 +21,15 @@ class Bar(Graph):
         # Call the parent class constructor
         super(Bar, self).__init__(*args, **kwargs)
 
+    @cached_property
+    def _bar_width(self):
+        """Width of the bars of a category, computed once per rendering"""
+        return (self.view.x(1) - self.view.x(0)) / (self._len*self._order/2)
+
     def _bar(self, serie, parent, x, y, i, zero, secondary=False, custom_shape=None):
         """Internal bar drawing function"""
-        # Calculate the width of each bar
-        width = (self.view.x(1) - self.view.x(0)) / (self._len*self._order/2)
+        # Get the width of each bar
+        width = self._bar_width
 
         # Apply bar spacing dynamically
         x, y = self.view((x, y))
@@ -47,6 +54,11 @@ class Bar(Graph):
 
         # Calculate the height of the bar
         height = self.view.y(zero) - y
+        if self._clip:
+            # Cut the part of the bar out of the view
+            top = min(max(y, 0), self.view.height)
+            bottom = min(max(y + height, 0), self.view.height)
+            y, height = top, bottom - top
         # Determine if the bar should have rounded corners
         r = serie.rounded_bars * 1 if serie.rounded_bars else 0
 
@@ -179,6 +191,11 @@ class Bar(Graph):
         for i, (x, y) in enumerate(points):
             if None in (x, y) or (self.logarithmic and y <= 0):
                 continue
+            if self._clip:
+                y_bar, y_zero = self.view.y(y), self.view.y(self.zero)
+                if (max(y_bar, y_zero) <= 0
+                        or min(y_bar, y_zero) >= self.view.height):
+                    continue
             metadata = serie.metadata.get(i)
             val = self._format(serie, i)
 
@@ -215,8 +232,8 @@ class Bar(Graph):
 
 # 4. Compute Bar Positions:
 
-# Loop over each bar index i from 0 to self._len - 1 (where self._len is the number of bars):
-# If scaled_spacing is defined and the current index i is not 0, add the previous spacing value to cumulative_spacing. This accounts for the spacing between the current bar and the previous bar.
+# The cumulative spacing before each bar is the prefix sum of the spacing values (each one relative to the sum of scaled_spacing), computed once for all the bars.
+# For each bar index i from 0 to self._len - 1 (where self._len is the number of bars):
 # Calculate the x-position pos for the current bar. The position is determined by the bar index i, the cumulative spacing up to the previous bar, and the total number of bars. Specifically:
 # (i + 0.5) / self._len places the bar at the center of its segment within the total width.
 # cumulative_spacing / self._len adjusts the position to account for the cumulative spacing between bars.
@@ -252,9 +269,6 @@ class Bar(Graph):
         if self._max:
             self._box.ymax = max(self._max, self.zero)
 
-        cumulative_spacing = 0  # Initialize cumulative spacing
-        self._x_pos = []  # Initialize list for bar positions
-
         # Calculate total spacing if bar_spacing is specified
         if self.bar_spacing:
             total_spacing = sum(self.bar_spacing)
@@ -268,14 +282,25 @@ class Bar(Graph):
         else:
             scaled_spacing = self.bar_spacing
 
+        # Cumulative spacing before each bar, as prefix sums
+        cumulative_spacing = [0] * self._len
+        if scaled_spacing and self._len:
+            spacing_sum = sum(scaled_spacing)
+            steps = min(len(scaled_spacing), self._len) - 1
+            cumulative_spacing = list(accumulate(
+                (s / spacing_sum * (self._len - 1)
+                 for s in scaled_spacing[:steps]),
+                initial=0
+            ))
+            cumulative_spacing += (
+                cumulative_spacing[-1:] * (self._len - steps - 1)
+            )
+
         # Compute positions for bars with the scaled spacing
-        for i in range(self._len):
-            if scaled_spacing and len(scaled_spacing) > i and i != 0:
-                cumulative_spacing += scaled_spacing[i - 1] / sum(scaled_spacing) * (self._len - 1)
-            
-            # Calculate the position
-            pos = (i + .001) / self._len + cumulative_spacing / self._len
-            self._x_pos.append(pos)
+        self._x_pos = [
+            (i + .001) / self._len + cumulative / self._len
+            for i, cumulative in enumerate(cumulative_spacing)
+        ]
 
         # Adjust positions so that the last position ends at 1 and the view is not cropped
         if self._x_pos and self._x_pos[-1] > 1:
@@ -19,23 +19,39 @@
 """Base for pygal charts"""
 
 import os
-from functools import reduce
+import warnings
+from concurrent.futures import CancelledError
+from copy import copy
 from uuid import uuid4
 
 from pygal._compat import is_list_like
-from pygal.adapters import decimal_to_float, not_zero, positive
+from pygal.adapters import (
+    compile_adapters,
+    decimal_to_float,
+    not_zero,
+    numbers_adapter,
+    positive,
+)
+from pygal.columns import column_to_list, is_column
 from pygal.config import Config, SerieConfig
 from pygal.serie import Serie
 from pygal.state import State
 from pygal.svg import Svg
-from pygal.util import compose, ident
+from pygal.util import LRUCache, cached_property, ident
 from pygal.view import Box, Margin
 
+# Compiled adapters of the chart classes, see BaseGraph._compile_adapters
+adapters_cache = LRUCache(64)
+
 
 class BaseGraph(object):
     """Chart internal behaviour related functions"""
 
     _adapters = []
+    _cancelled = None
+    _svg_writer = None
+    # Whether the svg can be written while its series are drawn
+    _streamable = True
 
     def __init__(self, config=None, **kwargs):
         """Config preparation and various initialization"""
@@ -54,27 +70,16 @@ class BaseGraph(object):
         self.raw_series = []
         self.xml_filters = []
 
-    def __setattr__(self, name, value):
-        """Set an attribute on the class or in the state if there is one"""
-        if name.startswith('__') or getattr(self, 'state', None) is None:
-            super(BaseGraph, self).__setattr__(name, value)
-        else:
-            setattr(self.state, name, value)
-
-    def __getattribute__(self, name):
-        """Get an attribute from the class or from the state if there is one"""
-        if name.startswith('__') or name == 'state' or getattr(
-                self, 'state',
-                None) is None or name not in self.state.__dict__:
-            return super(BaseGraph, self).__getattribute__(name)
-        return getattr(self.state, name)
-
-    def prepare_values(self, raw, offset=0):
-        """Prepare the values to start with sane values"""
+    def prepare_values(self, raw, offset=0, width=0):
+        """
+        Prepare the values to start with sane values,
+        aligning the series on at least `width` values
+        """
         from pygal import Histogram
         from pygal.graph.map import BaseMap
 
-        if self.zero == 0 and isinstance(self, BaseMap):
+        is_map = isinstance(self, BaseMap)
+        if self.zero == 0 and is_map:
             self.zero = 1
 
         if self.x_label_rotation:
@@ -89,99 +94,236 @@ class BaseGraph(object):
         if not raw:
             return
 
-        adapters = list(self._adapters) or [lambda x: x]
-        if self.logarithmic:
-            for fun in not_zero, positive:
-                if fun in adapters:
-                    adapters.remove(fun)
-            adapters = adapters + [positive, not_zero]
-        adapters = adapters + [decimal_to_float]
-
-        self._adapt = reduce(compose, adapters) if not self.strict else ident
-        self._x_adapt = reduce(
-            compose, self._x_adapters
-        ) if not self.strict and getattr(self, '_x_adapters', None) else ident
+        key = type(self), bool(self.logarithmic), bool(self.strict)
+        compiled = adapters_cache.get(key)
+        if compiled is None:
+            compiled = adapters_cache[key] = self._compile_adapters()
+        adapters, self._adapt, self._x_adapt, self._adapt_numbers = compiled
 
         series = []
+        raw = list(raw)
+        # Columns of simple values are adapted at once (see pygal.columns)
+        vectorize = not self._dual and not isinstance(self, Histogram)
+        adapted = []
 
-        raw = [(
-            list(raw_values) if not isinstance(raw_values, dict) else
-            raw_values, serie_config_kwargs
-        ) for raw_values, serie_config_kwargs in raw]
+        for i, (raw_values, serie_config_kwargs) in enumerate(raw):
+            if isinstance(raw_values, dict):
+                continue
+            if not is_column(raw_values):
+                raw_values = list(raw_values)
+            elif vectorize and raw_values.ndim == 1:
+                raw_values, remaining = column_to_list(
+                    raw_values, adapters[::-1]
+                )
+                if remaining:
+                    adapt = compile_adapters(remaining[::-1])
+                    raw_values = [adapt(value) for value in raw_values]
+                adapted.append(i)
+            else:
+                raw_values, _ = column_to_list(raw_values)
+            raw[i] = raw_values, serie_config_kwargs
 
-        width = max([len(values)
-                     for values, _ in raw] + [len(self.x_labels or [])])
+        width = max([len(values) for values, _ in raw] +
+                    [len(self.x_labels or []), width])
 
-        for raw_values, serie_config_kwargs in raw:
-            metadata = {}
-            values = []
-            if isinstance(raw_values, dict):
-                if isinstance(self, BaseMap):
-                    raw_values = list(raw_values.items())
-                else:
-                    value_list = [None] * width
-                    for k, v in raw_values.items():
-                        if k in (self.x_labels or []):
-                            value_list[self.x_labels.index(k)] = v
-                    raw_values = value_list
-
-            for index, raw_value in enumerate(raw_values + (
-                (width - len(raw_values)) * [None]  # aligning values
-                    if len(raw_values) < width else [])):
-                if isinstance(raw_value, dict):
-                    raw_value = dict(raw_value)
-                    value = raw_value.pop('value', None)
-                    metadata[index] = raw_value
-                else:
-                    value = raw_value
-
-                # Fix this by doing this in charts class methods
-                if isinstance(self, Histogram):
-                    if value is None:
-                        value = (None, None, None)
-                    elif not is_list_like(value):
-                        value = (value, self.zero, self.zero)
-                    elif len(value) == 2:
-                        value = (1, value[0], value[1])
-                    value = list(map(self._adapt, value))
-                elif self._dual:
-                    if value is None:
-                        value = (None, None)
-                    elif not is_list_like(value):
-                        value = (value, self.zero)
-                    if self._x_adapt:
-                        value = (
-                            self._x_adapt(value[0]), self._adapt(value[1])
-                        )
-                    if isinstance(self, BaseMap):
-                        value = (self._adapt(value[0]), value[1])
-                    else:
-                        value = list(map(self._adapt, value))
-                else:
-                    value = self._adapt(value)
+        # Serie options default to the chart ones
+        chart_serie_config = SerieConfig(
+            **dict((k, v) for k, v in self.state.__dict__.items()
+                   if k in SerieConfig._options)
+        )
 
-                values.append(value)
-            serie_config = SerieConfig()
-            serie_config(
-                **dict((k, v) for k, v in self.state.__dict__.items()
-                       if k in dir(serie_config))
-            )
+        unknown_keys = []
+        for i, (raw_values, serie_config_kwargs) in enumerate(raw):
+            metadata = {}
+            if adapted and adapted[0] == i:
+                adapted.pop(0)
+                values = raw_values
+                if len(values) < width:
+                    # aligning values
+                    values.extend([self._adapt(None)] * (width - len(values)))
+            else:
+                if isinstance(raw_values, dict) and not is_map:
+                    raw_values, unknown = self._align_values(
+                        raw_values, width
+                    )
+                    if unknown:
+                        unknown_keys.append((
+                            serie_config_kwargs.get('title', offset + i),
+                            unknown
+                        ))
+                values = self._prepare_serie_values(
+                    raw_values, metadata, width
+                )
+            serie_config = copy(chart_serie_config)
             serie_config(**serie_config_kwargs)
             series.append(
                 Serie(offset + len(series), values, serie_config, metadata)
             )
+
+        if unknown_keys:
+            warnings.warn(
+                'Values ignored for the keys not in x_labels: %s' % '; '.join(
+                    '%s: %s%s' % (
+                        title, ', '.join(map(repr, keys[:10])),
+                        ' and %d more' % (len(keys) - 10)
+                        if len(keys) > 10 else ''
+                    ) for title, keys in unknown_keys
+                )
+            )
         return series
 
+    def _compile_adapters(self):
+        """
+        Compile the value adapters of the chart once for its class,
+        logarithmic and strict options.
+        Return the adapters (applied from the last to the first),
+        the value and x value adapting functions and the function
+        adapting at once the series of numbers (see numbers_adapter)
+        """
+        from pygal import Histogram
+        from pygal.graph.map import BaseMap
+
+        if self.strict:
+            adapters = x_adapters = ()
+        else:
+            adapters = list(self._adapters) or [ident]
+            if self.logarithmic:
+                for fun in not_zero, positive:
+                    if fun in adapters:
+                        adapters.remove(fun)
+                adapters = adapters + [positive, not_zero]
+            adapters = tuple(adapters + [decimal_to_float])
+            x_adapters = tuple(getattr(self, '_x_adapters', None) or ())
+
+        if isinstance(self, Histogram):
+            adapt_numbers = numbers_adapter(adapters, 3)
+        elif isinstance(self, BaseMap):
+            adapt_numbers = None
+        elif self._dual:
+            adapt_numbers = numbers_adapter(adapters + x_adapters, 2)
+        else:
+            adapt_numbers = numbers_adapter(adapters)
+        return (
+            adapters, compile_adapters(adapters),
+            compile_adapters(x_adapters), adapt_numbers
+        )
+
+    @cached_property
+    def _x_labels_positions(self):
+        """Position of each x label (the first one of repeated labels)"""
+        positions = {}
+        for i, label in enumerate(self.x_labels or ()):
+            try:
+                positions.setdefault(label, i)
+            except TypeError:
+                # Unhashable labels can't be keys
+                pass
+        return positions
+
+    def _align_values(self, raw_values, width):
+        """
+        Place the values of a dict serie at the position of their key
+        in x_labels and return them with the keys not in x_labels
+        """
+        positions = self._x_labels_positions
+        values = [None] * width
+        unknown = []
+        for key, value in raw_values.items():
+            position = positions.get(key)
+            if position is None:
+                unknown.append(key)
+            else:
+                values[position] = value
+        return values, unknown
+
+    def _extend_x_labels(self):
+        """Add the keys of dict series missing from x_labels to x_labels"""
+        x_labels = list(self.x_labels or ())
+        known = set(self._x_labels_positions)
+        for raw_values, _ in self.raw_series:
+            if isinstance(raw_values, dict):
+                for key in raw_values:
+                    if key not in known:
+                        known.add(key)
+                        x_labels.append(key)
+        self.x_labels = x_labels
+        del self._x_labels_positions
+
+    def _prepare_serie_values(self, raw_values, metadata, width):
+        """Adapt the values of a serie one by one, filling metadata"""
+        from pygal import Histogram
+        from pygal.graph.map import BaseMap
+
+        if isinstance(raw_values, dict):
+            # Map areas values (other dict series are aligned beforehand)
+            raw_values = list(raw_values.items())
+        elif self._adapt_numbers:
+            # Series of numbers are adapted at once
+            values = self._adapt_numbers(raw_values)
+            if values is not None:
+                if len(values) < width:
+                    values.extend(
+                        self._prepare_serie_values(
+                            [None] * (width - len(values)), metadata, 0
+                        )
+                    )
+                return values
+
+        values = []
+
+        for index, raw_value in enumerate(raw_values + (
+            (width - len(raw_values)) * [None]  # aligning values
+                if len(raw_values) < width else [])):
+            if isinstance(raw_value, dict):
+                raw_value = dict(raw_value)
+                value = raw_value.pop('value', None)
+                metadata[index] = raw_value
+            else:
+                value = raw_value
+
+            # Fix this by doing this in charts class methods
+            if isinstance(self, Histogram):
+                if value is None:
+                    value = (None, None, None)
+                elif not is_list_like(value):
+                    value = (value, self.zero, self.zero)
+                elif len(value) == 2:
+                    value = (1, value[0], value[1])
+                value = list(map(self._adapt, value))
+            elif self._dual:
+                if value is None:
+                    value = (None, None)
+                elif not is_list_like(value):
+                    value = (value, self.zero)
+                if self._x_adapt:
+                    value = (
+                        self._x_adapt(value[0]), self._adapt(value[1])
+                    )
+                if isinstance(self, BaseMap):
+                    value = (self._adapt(value[0]), value[1])
+                else:
+                    value = list(map(self._adapt, value))
+            else:
+                value = self._adapt(value)
+
+            values.append(value)
+        return values
+
     def setup(self, **kwargs):
         """Set up the transient state prior rendering"""
+        if self.state is not None:
+            # Kept by PYGAL_KEEP_STATE
+            self.state.unbind(self)
         # Keep labels in case of map
         if getattr(self, 'x_labels', None) is not None:
             self.x_labels = list(self.x_labels)
         if getattr(self, 'y_labels', None) is not None:
             self.y_labels = list(self.y_labels)
-        self.state = State(self, **kwargs)
+        State(self, **kwargs).bind(self)
         if isinstance(self.style, type):
             self.style = self.style()
+        if self.extend_x_labels:
+            self._extend_x_labels()
         self.series = self.prepare_values([
             rs for rs in self.raw_series if not rs[1].get('secondary')
         ]) or []
@@ -216,15 +358,22 @@ class BaseGraph(object):
         if self._len < 3:
             self.interpolate = None
         self._draw()
-        self.svg.pre_render()
+        if not self.svg.open_nodes:
+            # Else done before writing the first chunk
+            self.svg.pre_render()
+
+    def _check_cancelled(self):
+        """Abort the rendering if it has been cancelled (see render_async)"""
+        if self._cancelled is not None and self._cancelled.is_set():
+            raise CancelledError()
 
     def teardown(self):
         """Remove the transient state after rendering"""
         if os.getenv('PYGAL_KEEP_STATE'):
             return
 
-        del self.state
-        self.state = None
+        if self.state is not None:
+            self.state.unbind(self)
 
     def _repr_svg_(self):
         """Display svg in IPython notebook"""
@@ -18,12 +18,14 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Chart properties and drawing"""
 
-from math import ceil, cos, sin, sqrt
+from array import array
+from math import ceil, cos, hypot, sin, sqrt
 
 # from pygal import stats
 from pygal._compat import is_list_like
 from pygal.graph.public import PublicApi
-from pygal.interpolate import INTERPOLATIONS
+from pygal.interpolate import interpolate_arrays
+from pygal.serie import Points
 from pygal.util import (
     cached_property,
     compute_scale,
@@ -38,13 +40,14 @@ from pygal.util import (
     split_title,
     truncate,
 )
-from pygal.view import LogView, ReverseView, View, XYLogView
+from pygal.view import Box, LogView, ReverseView, View, XYLogView
 
 
 class Graph(PublicApi):
     """Graph super class containing generic common functions"""
 
     _dual = False
+    _incremental = False
 
     def _decorate(self):
         """Draw all decorations"""
@@ -175,7 +178,7 @@ class Graph(PublicApi):
             self.svg.node(
                 axis,
                 'path',
-                d='M%f %f v%f' % (0, 0, self.view.height),
+                d='M%s %s v%s' % self.svg.coords(0, 0, self.view.height),
                 class_='line'
             )
             lastlabel = None
@@ -196,7 +199,8 @@ class Graph(PublicApi):
             self.svg.node(
                 guides,
                 'path',
-                d='M%f %f v%f' % (x or 0, 0, self.view.height),
+                d='M%s %s v%s' %
+                self.svg.coords(x or 0, 0, self.view.height),
                 class_='%s%s%sline' % (
                     'axis ' if label == "0" else '', 'major '
                     if major else '', 'guide '
@@ -232,7 +236,8 @@ class Graph(PublicApi):
             self.svg.node(
                 axis,
                 'path',
-                d='M%f %f v%f' % (self.view.width, 0, self.view.height),
+                d='M%s %s v%s' %
+                self.svg.coords(self.view.width, 0, self.view.height),
                 class_='line'
             )
 
@@ -279,7 +284,7 @@ class Graph(PublicApi):
             self.svg.node(
                 axis,
                 'path',
-                d='M%f %f h%f' % (
+                d='M%s %s h%s' % self.svg.coords(
                     0, 0 if self.inverse_y_axis else self.view.height,
                     self.view.width
                 ),
@@ -307,7 +312,7 @@ class Graph(PublicApi):
                 self.svg.node(
                     guides,
                     'path',
-                    d='M%f %f h%f' % (0, y, self.view.width),
+                    d='M%s %s h%s' % self.svg.coords(0, y, self.view.width),
                     class_='%s%s%sline' % (
                         'axis ' if label == "0" else '', 'major '
                         if major else '', 'guide ' if position != 0 else ''
@@ -528,15 +533,41 @@ class Graph(PublicApi):
                 x.append(xs[i])
                 y.append(ys[i])
 
-        interpolate = INTERPOLATIONS[self.interpolate]
+        if self.interpolation_density and len(x) > 1:
+            precision = self._adaptive_precision(x, y)
+        else:
+            precision = self.interpolation_precision
 
-        return list(
-            interpolate(
-                x, y, self.interpolation_precision,
+        return Points(
+            *interpolate_arrays(
+                self.interpolate, x, y, precision,
                 **self.interpolation_parameters
             )
         )
 
+    def _adaptive_precision(self, x, y):
+        """
+        Get the precision of each segment to have `interpolation_density`
+        points per pixel of chart width, distributed by segment length.
+        (The plot width is not known yet when interpolating)
+        """
+        width, height = self.width, self.height
+        if self.horizontal:
+            width, height = height, width
+        x_scale = width / ((max(x) - min(x)) or 1)
+        y_scale = height / ((max(y) - min(y)) or 1)
+        lengths = [
+            hypot((x2 - x1) * x_scale, (y2 - y1) * y_scale)
+            for x1, x2, y1, y2 in zip(x, x[1:], y, y[1:])
+        ]
+        points = self.interpolation_density * width / (sum(lengths) or 1)
+        return [max(1, int(length * points)) for length in lengths]
+
+    @property
+    def _clip(self):
+        """Tell if values can be out of the view and must be clipped"""
+        return bool(self.range or self.xrange)
+
     def _rescale(self, points):
         """Scale for secondary"""
         return [(
@@ -555,8 +586,10 @@ class Graph(PublicApi):
                 classes.append('top')
             classes = ' '.join(classes)
 
-        self.svg.node(node, 'desc', class_="x " + classes).text = str(x)
-        self.svg.node(node, 'desc', class_="y " + classes).text = str(y)
+        self.svg.node(node, 'desc',
+                      class_="x " + classes).text = self.svg.format(x)
+        self.svg.node(node, 'desc',
+                      class_="y " + classes).text = self.svg.format(y)
         if xlabel:
             self.svg.node(node, 'desc', class_="x_label").text = str(xlabel)
 
@@ -608,8 +641,10 @@ class Graph(PublicApi):
         Convert given data values into drawable points (x, y)
         and interpolated points if interpolate option is specified
         """
+        # All the series share the same x positions
+        x_pos = array('d', x_pos)
         for serie in self.all_series:
-            serie.points = [(x_pos[i], v) for i, v in enumerate(serie.values)]
+            serie.points = Points(x_pos, serie.values)
             if serie.points and self.interpolate:
                 serie.interpolated = self._interpolate(x_pos, serie.values)
             else:
@@ -1004,8 +1039,14 @@ class Graph(PublicApi):
                 self.nodes['plot'],
                 'path',
                 class_='bg-lines',
-                d='M%s %s L%s %s' %
-                (_current_x, 0, _current_x, self.height - self.margin_box.y)
+                d='M%s %s L%s %s' % tuple(
+                    map(
+                        self.svg.format, (
+                            _current_x, 0, _current_x,
+                            self.height - self.margin_box.y
+                        )
+                    )
+                )
             )
 
         for line in range(y_lines):
@@ -1014,14 +1055,21 @@ class Graph(PublicApi):
                 self.nodes['plot'],
                 'path',
                 class_='bg-lines',
-                d='M%s %s L%s %s' %
-                (0, _current_y, self.width - self.margin_box.x, _current_y)
+                d='M%s %s L%s %s' % tuple(
+                    map(
+                        self.svg.format, (
+                            0, _current_y, self.width - self.margin_box.x,
+                            _current_y
+                        )
+                    )
+                )
             )
         return ((self.width - self.margin_box.x) / squares[0],
                 (self.height - self.margin_box.y) / squares[1])
 
     def _draw(self):
         """Draw all the things"""
+        self._check_cancelled()
         self._compute()
         self._compute_x_labels()
         self._compute_x_labels_major()
@@ -1030,12 +1078,71 @@ class Graph(PublicApi):
         self._compute_secondary()
         self._post_compute()
         self._compute_margin()
+        self._check_cancelled()
         self._decorate()
         if self.series and self._has_data() and self._values:
             self._plot()
         else:
             self.svg.draw_no_data()
 
+    def _redraw(self, changed):
+        """
+        Redraw the changed series (indexes in raw_series) in the previous
+        rendering, return False if their values don't fit in its box.
+        Only the changed series are prepared and computed again.
+        """
+        if (not self._incremental or self.secondary_series
+                or self.xml_filters or not self._values):
+            return False
+
+        old_box = self._box
+        old_len = self._len
+        series = self.series
+        # Compute the changed series alone in a new box
+        self._clear_cached_properties()
+        self.series = [
+            self.prepare_values([self.raw_series[index]], index, old_len)[0]
+            for index in changed
+        ]
+        self._box = Box()
+        self._compute()
+        self._post_compute()
+        box = self._box
+        self._box = old_box
+        if (self._len != old_len or not self._values
+                or box.xmin < old_box.xmin or box.xmax > old_box.xmax
+                or box.ymin < old_box.ymin or box.ymax > old_box.ymax):
+            return False
+
+        for serie in self.series:
+            series[serie.index] = serie
+        self.series = series
+        self._clear_cached_properties()
+        for index in changed:
+            self._check_cancelled()
+            positions = []
+            class_ = 'series serie-%d color-%d' % (index, index)
+            for key in ('plot', 'overlay', 'text_overlay'):
+                parent = self.nodes[key]
+                for position, node in enumerate(parent):
+                    if node.get('class') == class_:
+                        parent.remove(node)
+                        positions.append((parent, position))
+                        break
+            self._plot_serie(self.series[index])
+            # Put the new serie nodes back in place
+            for parent, position in positions:
+                node = parent[-1]
+                parent.remove(node)
+                parent.insert(position, node)
+        return True
+
+    def _clear_cached_properties(self):
+        """Forget the cached properties computed on the previous series"""
+        for name in dir(self.__class__):
+            if isinstance(getattr(self.__class__, name), cached_property):
+                self.__dict__.pop(name, None)
+
     def _has_data(self):
         """Check if there is any data"""
         return any([
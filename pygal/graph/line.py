@@ -21,6 +21,7 @@ Line chart: Display series of data as markers (dots)
 connected by straight segments
 """
 
+from pygal.decimate import decimate
 from pygal.graph.graph import Graph
 from pygal.util import alter, cached_property, decorate
 
@@ -28,6 +29,8 @@ from pygal.util import alter, cached_property, decorate
 class Line(Graph):
     """Line graph class"""
 
+    _incremental = True
+
     def __init__(self, *args, shape='circle', shape_attributes=None, **kwargs):
         """Set _self_close as False, it's True for Radar like Line"""
         self._self_close = False
@@ -91,10 +94,17 @@ class Line(Graph):
         else:
             points = serie.points
         view_values = list(map(self.view, points))
+        if self.decimate:
+            kept = decimate(view_values, self.decimate)
+        else:
+            kept = range(len(view_values))
         if serie.show_dots:
-            for i, (x, y) in enumerate(view_values):
+            for i in kept:
+                x, y = view_values[i]
                 if None in (x, y):
                     continue
+                if self._clip and not self.view.contains(x, y):
+                    continue
                 if self.logarithmic:
                     if points[i][1] is None or points[i][1] <= 0:
                         continue
@@ -172,6 +182,17 @@ class Line(Graph):
                 if rescale and self.secondary_series:
                     points = self._rescale(points)
                 view_values = list(map(self.view, points))
+                if self.decimate:
+                    kept = decimate(view_values, self.decimate)
+            if self.decimate:
+                points = [points[i] for i in kept]
+                view_values = [view_values[i] for i in kept]
+            if self.logarithmic:
+                # Values out of the logarithmic scale are missing
+                view_values = [
+                    view if y is not None and y > 0 else (view[0], None)
+                    for (_, y), view in zip(points, view_values)
+                ]
             if serie.fill:
                 view_values = self._fill(view_values)
 
@@ -197,12 +218,15 @@ class Line(Graph):
             else:
                 # plain vanilla rendering
                 sequences = [view_values]
-            if self.logarithmic:
+            if self._clip:
+                clipped = []
                 for seq in sequences:
-                    for ele in seq[::-1]:
-                        y = points[seq.index(ele)][1]
-                        if y is None or y <= 0:
-                            del seq[seq.index(ele)]
+                    seq = [c for c in seq if None not in c]
+                    if serie.fill:
+                        clipped.append(self.view.clip_polygon(seq))
+                    else:
+                        clipped.extend(self.view.clip(seq))
+                sequences = clipped
             for seq in sequences:
                 self.svg.line(
                     serie_node['plot'],
@@ -234,6 +258,10 @@ class Line(Graph):
             self._box.ymin = self._min
             self._box.ymax = self._max
 
+    def _plot_serie(self, serie):
+        """Plot a serie line alone to redraw a stream"""
+        self.line(serie)
+
     def _plot(self):
         """Plot the serie lines and secondary serie lines"""
         for serie in self.series:
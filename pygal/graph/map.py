@@ -22,10 +22,40 @@ see the pygal_maps_world package to get an exemple.
 https://github.com/Kozea/pygal_maps_world
 """
 
+from copy import deepcopy
+
 from pygal.etree import etree
 from pygal.graph.graph import Graph
 from pygal.util import alter, cached_property, cut, decorate
 
+# Parsed map templates by etree implementation and svg map
+_templates = {}
+
+
+def _template(svg_map):
+    """
+    Parse a svg map once and index its areas by class.
+
+    Areas are indexed by their path (child indexes from the root)
+    so that they can be found in any copy of the template.
+    """
+    key = etree.lxml, svg_map
+    if key not in _templates:
+        root = etree.fromstring(svg_map)
+        index = {}
+        stack = [((), root)]
+        while stack:
+            path, node = stack.pop()
+            cls = node.get('class')
+            if cls and cls.endswith(' map-element'):
+                index.setdefault(cls, []).append(path)
+            # Reversed to keep areas in document order
+            stack.extend(reversed([
+                (path + (i, ), child) for i, child in enumerate(node)
+            ]))
+        _templates[key] = root, index
+    return _templates[key]
+
 
 class BaseMap(Graph):
     """Base class for maps"""
@@ -59,10 +89,17 @@ class BaseMap(Graph):
 
     def _plot(self):
         """Insert a map in the chart and apply data on it"""
-        map = etree.fromstring(self.svg_map)
+        template, index = _template(self.svg_map)
+        map = deepcopy(template)
         map.set('width', str(self.view.width))
         map.set('height', str(self.view.height))
 
+        def find(path):
+            node = map
+            for i in path:
+                node = node[i]
+            return node
+
         for i, serie in enumerate(self.series):
             safe_vals = list(
                 filter(lambda x: x is not None, cut(serie.values, 1))
@@ -80,20 +117,19 @@ class BaseMap(Graph):
                 else:
                     ratio = .3 + .7 * (value - min_) / (max_ - min_)
 
-                areae = map.findall(
-                    ".//*[@class='%s%s %s map-element']" %
-                    (self.area_prefix, area_code, self.kind)
+                area_class = '%s%s %s map-element' % (
+                    self.area_prefix, area_code, self.kind
                 )
 
-                if not areae:
-                    continue
-
-                for area in areae:
-                    cls = area.get('class', '').split(' ')
-                    cls.append('color-%d' % i)
-                    cls.append('serie-%d' % i)
-                    cls.append('series')
-                    area.set('class', ' '.join(cls))
+                for path in index.get(area_class, ()):
+                    area = find(path)
+                    if area.get('class') != area_class:
+                        # Already styled by a previous value
+                        continue
+                    area.set(
+                        'class',
+                        '%s color-%d serie-%d series' % (area_class, i, i)
+                    )
                     area.set('style', 'fill-opacity: %f' % ratio)
 
                     metadata = serie.metadata.get(j)
@@ -102,13 +138,10 @@ class BaseMap(Graph):
                         node = decorate(self.svg, area, metadata)
                         if node != area:
                             area.remove(node)
-                            for g in map:
-                                if area not in g:
-                                    continue
-                                index = list(g).index(area)
-                                g.remove(area)
-                                node.append(area)
-                                g.insert(index, node)
+                            parent = find(path[:-1])
+                            parent.remove(area)
+                            node.append(area)
+                            parent.insert(path[-1], node)
 
                     for node in area:
                         cls = node.get('class', '').split(' ')
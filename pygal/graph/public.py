@@ -18,24 +18,47 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """pygal public api functions"""
 
+import asyncio
 import base64
 import io
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from queue import Queue
+from threading import Event, Thread
 
 from pygal._compat import is_list_like
+from pygal.columns import as_column, is_column
+from pygal.etree import etree
 from pygal.graph.base import BaseGraph
+from pygal.serie import Stream
+from pygal.util import gzip_iter
 
 
 class PublicApi(BaseGraph):
     """Chart public functions"""
 
+    # Last rendering of a chart having streams: (key, state, values)
+    _stream_render = None
+
     def add(self, title, values, **kwargs):
         """Add a serie to this graph, compat api"""
-        if not is_list_like(values) and not isinstance(values, dict):
+        if is_column(values):
+            values = as_column(values)
+        elif not is_list_like(values) and not isinstance(values, dict):
             values = [values]
         kwargs['title'] = title
         self.raw_series.append((values, kwargs))
         return self
 
+    def add_stream(self, title, maxlen=None, values=(), **kwargs):
+        """
+        Add a live serie keeping its `maxlen` last values,
+        return the stream to append values to
+        """
+        stream = Stream(values, maxlen)
+        self.add(title, stream, **kwargs)
+        return stream
+
     def __call__(self, *args, **kwargs):
         """Call api: chart(1, 2, 3, title='T')"""
         self.raw_series.append((args, kwargs))
@@ -48,13 +71,135 @@ class PublicApi(BaseGraph):
 
     def render(self, is_unicode=False, **kwargs):
         """Render the graph, and return the svg string"""
-        self.setup(**kwargs)
-        svg = self.svg.render(
-            is_unicode=is_unicode, pretty_print=self.pretty_print
-        )
-        self.teardown()
+        if any(isinstance(values, Stream) for values, _ in self.raw_series):
+            return self._render_stream(is_unicode, kwargs)
+        try:
+            self.setup(**kwargs)
+            return self.svg.render(
+                is_unicode=is_unicode, pretty_print=self.pretty_print
+            )
+        finally:
+            self.teardown()
+
+    def _stream_key(self, kwargs):
+        """
+        Return what must not have changed since the previous rendering
+        to redraw only the changed streams in it
+        """
+        attributes = dict(self.config.__dict__)
+        attributes.update(self.__dict__)
+        attributes.update(kwargs)
+        del attributes['state']
+        attributes.pop('_stream_render', None)
+        raw_series = attributes.pop('raw_series')
+        return dict(
+            (k, list(v) if isinstance(v, list) else v)
+            for k, v in attributes.items()
+        ), [(
+            id(values) if isinstance(values, Stream) else
+            dict(values) if isinstance(values, dict) else list(values),
+            dict(serie_kwargs)
+        ) for values, serie_kwargs in raw_series]
+
+    def _render_stream(self, is_unicode, kwargs):
+        """
+        Render a graph with streams, redrawing only the changed streams
+        in the previous rendering when possible
+        """
+        key = self._stream_key(kwargs)
+        values = [
+            tuple(values) if isinstance(values, Stream) else None
+            for values, _ in self.raw_series
+        ]
+        previous = self._stream_render
+        self._stream_render = None
+        try:
+            if previous is not None and previous[0] == key:
+                previous[1].bind(self)
+                if not self._redraw([
+                        i for i, v in enumerate(values)
+                        if v is not None and v != previous[2][i]
+                ]):
+                    self.teardown()
+                    self.setup(**kwargs)
+            else:
+                self.setup(**kwargs)
+            svg = self.svg.render(
+                is_unicode=is_unicode, pretty_print=self.pretty_print
+            )
+            state = self.state
+        finally:
+            self.teardown()
+        self._stream_render = key, state, values
         return svg
 
+    def _redraw(self, changed):
+        """
+        Redraw the changed series in the previous rendering,
+        return False if it's not possible
+        """
+        return False
+
+    def render_iter(self, is_unicode=False, **kwargs):
+        """
+        Render the graph, and yield the svg in chunks: the start of the svg
+        up to the first serie, then each serie as the next one is drawn,
+        and the rest (overlays, legends…) at the end
+        """
+        if not etree.lxml or self.xml_filters or not self._streamable:
+            # The whole tree is needed
+            yield self.render(is_unicode=is_unicode, **kwargs)
+            return
+
+        # Drawing happens in a thread writing the chunks to this queue
+        chunks = Queue(1)
+        errors = []
+        cancelled = kwargs['_cancelled'] = Event()
+
+        def write(chunk):
+            if not is_unicode and not self.disable_xml_declaration:
+                chunk = chunk.encode('utf-8')
+            chunks.put(chunk)
+
+        def draw():
+            try:
+                self.setup(_svg_writer=write, **kwargs)
+                self.svg.flush()
+            except Exception as e:
+                if not cancelled.is_set():
+                    errors.append(e)
+            finally:
+                self.teardown()
+                chunks.put(None)
+
+        thread = Thread(target=draw, daemon=True)
+        thread.start()
+        done = False
+        try:
+            for chunk in iter(chunks.get, None):
+                yield chunk
+            done = True
+            if errors:
+                raise errors[0]
+        finally:
+            if not done:
+                # Closed before the end, stop drawing at the next serie
+                cancelled.set()
+                while chunks.get() is not None:
+                    pass
+            thread.join()
+
+    def render_gzip_iter(self, compresslevel=-1, **kwargs):
+        """
+        Render the graph, and yield the svg gzip compressed in chunks
+        as it is written
+        """
+        return gzip_iter(self.render_iter(**kwargs), compresslevel)
+
+    def render_gzip(self, compresslevel=-1, **kwargs):
+        """Render the graph, and return the gzip compressed svg (svgz)"""
+        return b''.join(self.render_gzip_iter(compresslevel, **kwargs))
+
     def render_tree(self, **kwargs):
         """Render the graph, and return (l)xml etree"""
         self.setup(**kwargs)
@@ -87,29 +232,92 @@ class PublicApi(BaseGraph):
         kwargs.setdefault('force_uri_protocol', 'https')
         open_in_browser(self.render_tree(**kwargs), encoding='utf-8')
 
-    def render_response(self, **kwargs):
-        """Render the graph, and return a Flask response"""
+    def render_response(self, gzip=False, **kwargs):
+        """
+        Render the graph, and return a Flask response,
+        gzip encoded if gzip is True
+        """
         from flask import Response
+        if gzip:
+            return Response(
+                self.render_gzip(**kwargs),
+                mimetype='image/svg+xml',
+                headers={'Content-Encoding': 'gzip'}
+            )
         return Response(self.render(**kwargs), mimetype='image/svg+xml')
 
-    def render_django_response(self, **kwargs):
-        """Render the graph, and return a Django response"""
+    def render_streaming_response(self, gzip=False, **kwargs):
+        """
+        Render the graph, and return a streamed Flask response,
+        gzip encoded if gzip is True
+        """
+        from flask import Response
+        if gzip:
+            return Response(
+                self.render_gzip_iter(**kwargs),
+                mimetype='image/svg+xml',
+                headers={'Content-Encoding': 'gzip'}
+            )
+        return Response(self.render_iter(**kwargs), mimetype='image/svg+xml')
+
+    def render_django_response(self, gzip=False, **kwargs):
+        """
+        Render the graph, and return a Django response,
+        gzip encoded if gzip is True
+        """
         from django.http import HttpResponse
+        if gzip:
+            response = HttpResponse(
+                self.render_gzip(**kwargs), content_type='image/svg+xml'
+            )
+            response['Content-Encoding'] = 'gzip'
+            return response
         return HttpResponse(
             self.render(**kwargs), content_type='image/svg+xml'
         )
 
-    def render_data_uri(self, **kwargs):
-        """Output a base 64 encoded data uri"""
+    def render_django_streaming_response(self, gzip=False, **kwargs):
+        """
+        Render the graph, and return a streamed Django response,
+        gzip encoded if gzip is True
+        """
+        from django.http import StreamingHttpResponse
+        if gzip:
+            response = StreamingHttpResponse(
+                self.render_gzip_iter(**kwargs), content_type='image/svg+xml'
+            )
+            response['Content-Encoding'] = 'gzip'
+            return response
+        return StreamingHttpResponse(
+            self.render_iter(**kwargs), content_type='image/svg+xml'
+        )
+
+    def render_data_uri(self, gzip=False, **kwargs):
+        """
+        Output a base 64 encoded data uri, of the gzip compressed svg
+        (image/svg+xml-compressed) if gzip is True
+        """
         # Force protocol as data uri have none
         kwargs.setdefault('force_uri_protocol', 'https')
+        if gzip:
+            return "data:image/svg+xml-compressed;base64,%s" % (
+                base64.b64encode(self.render_gzip(**kwargs)).decode('utf-8')
+            )
         return "data:image/svg+xml;charset=utf-8;base64,%s" % (
             base64.b64encode(self.render(**kwargs)
                              ).decode('utf-8').replace('\n', '')
         )
 
     def render_to_file(self, filename, **kwargs):
-        """Render the graph, and write it to filename"""
+        """
+        Render the graph, and write it to filename,
+        gzip compressed if filename ends with .svgz
+        """
+        if filename.lower().endswith('.svgz'):
+            with io.open(filename, 'wb') as f:
+                for chunk in self.render_gzip_iter(**kwargs):
+                    f.write(chunk)
+            return
         with io.open(filename, 'w', encoding='utf-8') as f:
             f.write(self.render(is_unicode=True, **kwargs))
 
@@ -120,6 +328,87 @@ class PublicApi(BaseGraph):
             bytestring=self.render(**kwargs), write_to=filename, dpi=dpi
         )
 
+    async def _run_async(self, executor, method, *args, **kwargs):
+        """
+        Call the render `method` in the executor without blocking
+        the event loop
+        """
+        from pygal.parallel import (
+            call_chart,
+            copy_chart,
+            dump_chart,
+            get_executor,
+            get_manager,
+        )
+        loop = asyncio.get_running_loop()
+        executor = get_executor(executor)
+        # Workers can't be killed, the rendering checks this event instead
+        if isinstance(executor, ProcessPoolExecutor):
+            cancelled = kwargs['_cancelled'] = get_manager().Event()
+            future = loop.run_in_executor(
+                executor, call_chart, dump_chart(self), method, args, kwargs
+            )
+        else:
+            cancelled = kwargs['_cancelled'] = Event()
+            # A copy, as the chart state is its __dict__ while rendering
+            future = loop.run_in_executor(
+                executor,
+                partial(getattr(copy_chart(self), method), *args, **kwargs)
+            )
+        try:
+            return await future
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def _write_async(self, filename, data):
+        """Write data to filename in a thread"""
+
+        def write():
+            if isinstance(data, bytes):
+                with io.open(filename, 'wb') as f:
+                    f.write(data)
+            else:
+                with io.open(filename, 'w', encoding='utf-8') as f:
+                    f.write(data)
+
+        await asyncio.get_running_loop().run_in_executor(None, write)
+
+    async def render_async(self, is_unicode=False, executor=None, **kwargs):
+        """
+        Render the graph in an executor ('thread', 'process' or an Executor
+        instance), and return the svg string
+        """
+        return await self._run_async(
+            executor, 'render', is_unicode=is_unicode, **kwargs
+        )
+
+    async def render_to_file_async(self, filename, executor=None, **kwargs):
+        """
+        Render the graph in an executor, and write it to filename,
+        gzip compressed if filename ends with .svgz
+        """
+        if filename.lower().endswith('.svgz'):
+            svg = await self._run_async(executor, 'render_gzip', **kwargs)
+        else:
+            svg = await self.render_async(
+                is_unicode=True, executor=executor, **kwargs
+            )
+        await self._write_async(filename, svg)
+
+    async def render_to_png_async(
+            self, filename=None, dpi=72, executor=None, **kwargs):
+        """
+        Render the graph and convert it to png in an executor,
+        and write it to filename
+        """
+        png = await self._run_async(
+            executor, 'render_to_png', None, dpi, **kwargs
+        )
+        if filename is None:
+            return png
+        await self._write_async(filename, png)
+
     def render_sparktext(self, relative_to=None):
         """Make a mini text sparkline from chart"""
         bars = '▁▂▃▄▅▆▇█'
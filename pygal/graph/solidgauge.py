@@ -27,6 +27,10 @@ from pygal.util import alter, decorate
 
 
 class SolidGauge(Graph):
+
+    # The gauge backgrounds are added to the defs while plotting
+    _streamable = False
+
     def gaugify(self, serie, squares, sq_dimensions, current_square):
         serie_node = self.svg.serie(serie)
         if self.half_pie:
@@ -23,6 +23,7 @@ on top of the others instead of being displayed side by side.
 
 from pygal.adapters import none_to_zero
 from pygal.graph.bar import Bar
+from pygal.util import cached_property
 
 
 class StackedBar(Bar):
@@ -103,6 +104,11 @@ class StackedBar(Bar):
             positive_vals and max(max(positive_vals), self.zero)
         ) or self.zero
 
+    @cached_property
+    def _bar_width(self):
+        """Width of the stacked bars, computed once per rendering"""
+        return (self.view.x(1) - self.view.x(0)) / self._len
+
     def _bar(self, serie, parent, x, y, i, zero, secondary=False, custom_shape="None"):
         """Internal stacking bar drawing function"""
         if secondary:
@@ -122,7 +128,7 @@ class StackedBar(Bar):
             y -= self.zero
         y += zero
 
-        width = (self.view.x(1) - self.view.x(0)) / self._len
+        width = self._bar_width
         x, y = self.view((x, y))
         y = y or 0
         series_margin = width * self._series_margin
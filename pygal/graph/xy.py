@@ -21,6 +21,7 @@ XY Line graph: Plot a set of couple data points (x, y) connected by
 straight segments.
 """
 
+from bisect import bisect_left, bisect_right
 from functools import reduce
 
 from pygal.graph.dual import Dual
@@ -106,6 +107,31 @@ class XY(Line, Dual):
         else:
             xrng = None
 
+        for serie in self.all_series:
+            serie.points = serie.values
+            if self.interpolate:
+                points = sorted(
+                    filter(lambda t: None not in t, serie.points),
+                    key=lambda x: x[0]
+                )
+                if self.xrange and self.xvals:
+                    # Only interpolate the visible points and their neighbors
+                    xs = [x for x, y in points]
+                    points = points[
+                        max(bisect_left(xs, xmin) - 1, 0):
+                        bisect_right(xs, xmax) + 1]
+                vals = list(zip(*points))
+                serie.interpolated = self._interpolate(
+                    vals[0], vals[1]
+                ) if vals else []
+
+        if self.interpolate and self.xrange and self.xvals:
+            # The visible part of the interpolated lines must fit in the box
+            self.yvals = self.yvals + [
+                y for serie in self.series for x, y in serie.interpolated
+                if xmin <= x <= xmax
+            ]
+
         if self.yvals:
             ymin = self._min
             ymax = self._max
@@ -118,20 +144,7 @@ class XY(Line, Dual):
         else:
             yrng = None
 
-        for serie in self.all_series:
-            serie.points = serie.values
-            if self.interpolate:
-                vals = list(
-                    zip(
-                        *sorted(
-                            filter(lambda t: None not in t, serie.points),
-                            key=lambda x: x[0]
-                        )
-                    )
-                )
-                serie.interpolated = self._interpolate(vals[0], vals[1])
-
-        if self.interpolate:
+        if self.interpolate and not self.xrange:
             self.xvals = [
                 val[0] for serie in self.all_series
                 for val in serie.interpolated
@@ -22,18 +22,32 @@ Interpolation functions
 These functions takes two lists of points x and y and
 returns an iterator over the interpolation between all these points
 with `precision` interpolated points between each of them
+(`precision` can also be a list giving the precision of each segment)
 
+When numpy is available, `interpolate_arrays` computes the same points
+at once with the vectorized kernels. Its results are kept in
+`interpolation_cache`.
 """
 from __future__ import division
 
+from array import array
 from math import sin
+from operator import itemgetter
 
+from pygal._compat import is_list_like
+from pygal.columns import _numpy
+from pygal.util import LRUCache, ident
 
-def quadratic_interpolate(x, y, precision=250, **kwargs):
-    """
-    Interpolate x, y using a quadratic algorithm
-    https://en.wikipedia.org/wiki/Spline_(mathematics)
-    """
+
+def _precisions(precision, n):
+    """Get the precision of each of the n segments"""
+    if is_list_like(precision):
+        return list(precision)
+    return [precision] * n
+
+
+def _quadratic_coefficients(x, y):
+    """Get the quadratic spline a, b, c coefficients and x deltas"""
     n = len(x) - 1
     delta_x = [x2 - x1 for x1, x2 in zip(x, x[1:])]
     delta_y = [y2 - y1 for y1, y2 in zip(y, y[1:])]
@@ -48,22 +62,30 @@ def quadratic_interpolate(x, y, precision=250, **kwargs):
         b[i] = 2 * slope[i - 1] - b[i - 1]
 
     c = [(slope[i] - b[i]) / delta_x[i] if delta_x[i] else 0 for i in range(n)]
+    return a, b, c, delta_x
+
+
+def quadratic_interpolate(x, y, precision=250, **kwargs):
+    """
+    Interpolate x, y using a quadratic algorithm
+    https://en.wikipedia.org/wiki/Spline_(mathematics)
+    """
+    n = len(x) - 1
+    precision = _precisions(precision, n)
+    a, b, c, delta_x = _quadratic_coefficients(x, y)
 
     for i in range(n + 1):
         yield x[i], a[i]
         if i == n or delta_x[i] == 0:
             continue
-        for s in range(1, precision):
-            X = s * delta_x[i] / precision
+        for s in range(1, precision[i]):
+            X = s * delta_x[i] / precision[i]
             X2 = X * X
             yield x[i] + X, a[i] + b[i] * X + c[i] * X2
 
 
-def cubic_interpolate(x, y, precision=250, **kwargs):
-    """
-    Interpolate x, y using a cubic algorithm
-    https://en.wikipedia.org/wiki/Spline_interpolation
-    """
+def _cubic_coefficients(x, y):
+    """Get the cubic spline a, b, c, d coefficients and x deltas"""
     n = len(x) - 1
     # Spline equation is a + bx + cx² + dx³
     # ie: Spline part i equation is a[i] + b[i]x + c[i]x² + d[i]x³
@@ -90,40 +112,31 @@ def cubic_interpolate(x, y, precision=250, **kwargs):
         c[j] = z[j] - (m[j] * c[j + 1])
         b[j] = g[j] - (h[j] * (c[j + 1] + 2 * c[j])) / 3
         d[j] = (c[j + 1] - c[j]) / (3 * h[j])
+    return a, b, c, d, h
+
+
+def cubic_interpolate(x, y, precision=250, **kwargs):
+    """
+    Interpolate x, y using a cubic algorithm
+    https://en.wikipedia.org/wiki/Spline_interpolation
+    """
+    n = len(x) - 1
+    precision = _precisions(precision, n)
+    a, b, c, d, h = _cubic_coefficients(x, y)
 
     for i in range(n + 1):
         yield x[i], a[i]
         if i == n or h[i] == 0:
             continue
-        for s in range(1, precision):
-            X = s * h[i] / precision
+        for s in range(1, precision[i]):
+            X = s * h[i] / precision[i]
             X2 = X * X
             X3 = X2 * X
             yield x[i] + X, a[i] + b[i] * X + c[i] * X2 + d[i] * X3
 
 
-def hermite_interpolate(
-        x, y, precision=250, type='cardinal', c=None, b=None, t=None
-):
-    """
-    Interpolate x, y using the hermite method.
-    See https://en.wikipedia.org/wiki/Cubic_Hermite_spline
-
-    This interpolation is configurable and contain 4 subtypes:
-      * Catmull Rom
-      * Finite Difference
-      * Cardinal
-      * Kochanek Bartels
-
-    The cardinal subtype is customizable with a parameter:
-      * c: tension (0, 1)
-
-    This last type is also customizable using 3 parameters:
-      * c: continuity (-1, 1)
-      * b: bias       (-1, 1)
-      * t: tension    (-1, 1)
-
-    """
+def _hermite_tangents(x, y, type='cardinal', c=None, b=None, t=None):
+    """Get the hermite spline incoming and outgoing tangents and x deltas"""
     n = len(x) - 1
     m = [1] * (n + 1)
     w = [1] * (n + 1)
@@ -153,6 +166,34 @@ def hermite_interpolate(
             m[i] = w[i] = (1 - c) * (y[i + 1] - y[i - 1]) / (
                 x[i + 1] - x[i - 1]
             ) if x[i + 1] - x[i - 1] else 0
+    return m, w, delta_x
+
+
+def hermite_interpolate(
+        x, y, precision=250, type='cardinal', c=None, b=None, t=None
+):
+    """
+    Interpolate x, y using the hermite method.
+    See https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+
+    This interpolation is configurable and contain 4 subtypes:
+      * Catmull Rom
+      * Finite Difference
+      * Cardinal
+      * Kochanek Bartels
+
+    The cardinal subtype is customizable with a parameter:
+      * c: tension (0, 1)
+
+    This last type is also customizable using 3 parameters:
+      * c: continuity (-1, 1)
+      * b: bias       (-1, 1)
+      * t: tension    (-1, 1)
+
+    """
+    n = len(x) - 1
+    precision = _precisions(precision, n)
+    m, w, delta_x = _hermite_tangents(x, y, type, c, b, t)
 
     def p(i, x_):
         t = (x_ - x[i]) / delta_x[i]
@@ -173,8 +214,8 @@ def hermite_interpolate(
         yield x[i], y[i]
         if i == n or delta_x[i] == 0:
             continue
-        for s in range(1, precision):
-            X = x[i] + s * delta_x[i] / precision
+        for s in range(1, precision[i]):
+            X = x[i] + s * delta_x[i] / precision[i]
             yield X, p(i, X)
 
 
@@ -184,14 +225,15 @@ def lagrange_interpolate(x, y, precision=250, **kwargs):
     https://en.wikipedia.org/wiki/Lagrange_polynomial
     """
     n = len(x) - 1
+    precision = _precisions(precision, n)
     delta_x = [x2 - x1 for x1, x2 in zip(x, x[1:])]
     for i in range(n + 1):
         yield x[i], y[i]
         if i == n or delta_x[i] == 0:
             continue
 
-        for s in range(1, precision):
-            X = x[i] + s * delta_x[i] / precision
+        for s in range(1, precision[i]):
+            X = x[i] + s * delta_x[i] / precision[i]
             s = 0
             for k in range(n + 1):
                 p = 1
@@ -210,14 +252,15 @@ def trigonometric_interpolate(x, y, precision=250, **kwargs):
     As per http://en.wikipedia.org/wiki/Trigonometric_interpolation
     """
     n = len(x) - 1
+    precision = _precisions(precision, n)
     delta_x = [x2 - x1 for x1, x2 in zip(x, x[1:])]
     for i in range(n + 1):
         yield x[i], y[i]
         if i == n or delta_x[i] == 0:
             continue
 
-        for s in range(1, precision):
-            X = x[i] + s * delta_x[i] / precision
+        for s in range(1, precision[i]):
+            X = x[i] + s * delta_x[i] / precision[i]
             s = 0
             for k in range(n + 1):
                 p = 1
@@ -230,6 +273,133 @@ def trigonometric_interpolate(x, y, precision=250, **kwargs):
             yield X, s
 
 
+def _samples(delta_x, precision, numpy):
+    """
+    Get the segment index and the x offset of each interpolated point,
+    `precision - 1` points being interpolated in each non empty segment,
+    and the number of interpolated points in each segment
+    """
+    precision = numpy.broadcast_to(precision, delta_x.shape)
+    counts = numpy.where(delta_x != 0, numpy.maximum(precision - 1, 0), 0)
+    segment = numpy.repeat(numpy.arange(len(delta_x)), counts)
+    s = numpy.arange(1, len(segment) + 1) - numpy.repeat(
+        numpy.cumsum(counts) - counts, counts
+    )
+    return segment, s * delta_x[segment] / precision[segment], counts
+
+
+def _join(x, y, X, Y, counts, numpy):
+    """
+    Join the points and the interpolated points in a flat x and y array,
+    each point being followed by the points interpolated in its segment
+    """
+    xs = numpy.empty(len(x) + len(X))
+    ys = numpy.empty(len(xs))
+    points = numpy.arange(len(x)) + numpy.concatenate(
+        ([0], numpy.cumsum(counts))
+    )
+    xs[points] = x
+    ys[points] = y
+    interpolated = numpy.ones(len(xs), dtype=bool)
+    interpolated[points] = False
+    xs[interpolated] = X
+    ys[interpolated] = Y
+    return xs, ys
+
+
+def quadratic_kernel(x, y, precision, numpy, **kwargs):
+    """Vectorized `quadratic_interpolate`"""
+    a, b, c, delta_x = map(
+        numpy.array, _quadratic_coefficients(x, y), [float] * 4
+    )
+    i, X, counts = _samples(delta_x, precision, numpy)
+    X2 = X * X
+    Y = a[i] + b[i] * X + c[i] * X2
+    x = numpy.array(x, dtype=float)
+    return _join(x, a, x[i] + X, Y, counts, numpy)
+
+
+def cubic_kernel(x, y, precision, numpy, **kwargs):
+    """Vectorized `cubic_interpolate`"""
+    a, b, c, d, h = map(
+        numpy.array, _cubic_coefficients(x, y), [float] * 5
+    )
+    i, X, counts = _samples(h, precision, numpy)
+    X2 = X * X
+    X3 = X2 * X
+    Y = a[i] + b[i] * X + c[i] * X2 + d[i] * X3
+    x = numpy.array(x, dtype=float)
+    return _join(x, a, x[i] + X, Y, counts, numpy)
+
+
+def hermite_kernel(
+        x, y, precision, numpy, type='cardinal', c=None, b=None, t=None
+):
+    """Vectorized `hermite_interpolate`"""
+    m, w, delta_x = map(
+        numpy.array, _hermite_tangents(x, y, type, c, b, t), [float] * 3
+    )
+    x = numpy.array(x, dtype=float)
+    y = numpy.array(y, dtype=float)
+    i, X, counts = _samples(delta_x, precision, numpy)
+    X = x[i] + X
+    t = (X - x[i]) / delta_x[i]
+    t2 = t * t
+    t3 = t2 * t
+
+    h00 = 2 * t3 - 3 * t2 + 1
+    h10 = t3 - 2 * t2 + t
+    h01 = -2 * t3 + 3 * t2
+    h11 = t3 - t2
+
+    Y = (
+        h00 * y[i] + h10 * m[i] * delta_x[i] + h01 * y[i + 1] +
+        h11 * w[i + 1] * delta_x[i]
+    )
+    return _join(x, y, X, Y, counts, numpy)
+
+
+def _polynomial_kernel(x, y, precision, numpy, basis, vector_basis):
+    """
+    Interpolate all the points at once with a sum of `basis` products
+    as `lagrange_interpolate` and `trigonometric_interpolate` do
+    """
+    n = len(x) - 1
+    delta_x = numpy.array(
+        [x2 - x1 for x1, x2 in zip(x, x[1:])], dtype=float
+    )
+    i, X, counts = _samples(delta_x, precision, numpy)
+    X = numpy.array(x, dtype=float)[i] + X
+    Y = numpy.zeros(X.shape)
+    for k in range(n + 1):
+        p = 1
+        for m in range(n + 1):
+            if m == k:
+                continue
+            d = basis(x[k] - x[m])
+            if d:
+                p = p * (vector_basis(X - x[m]) / d)
+        Y = Y + y[k] * p
+    return _join(
+        numpy.array(x, dtype=float), numpy.array(y, dtype=float), X, Y,
+        counts, numpy
+    )
+
+
+def lagrange_kernel(x, y, precision, numpy, **kwargs):
+    """Vectorized `lagrange_interpolate`"""
+    return _polynomial_kernel(
+        x, y, precision, numpy, ident, ident
+    )
+
+
+def trigonometric_kernel(x, y, precision, numpy, **kwargs):
+    """Vectorized `trigonometric_interpolate`"""
+    return _polynomial_kernel(
+        x, y, precision, numpy,
+        lambda d: sin(.5 * d), lambda d: numpy.sin(.5 * d)
+    )
+
 INTERPOLATIONS = {
     'quadratic': quadratic_interpolate,
     'cubic': cubic_interpolate,
@@ -238,6 +408,66 @@ INTERPOLATIONS = {
     'trigonometric': trigonometric_interpolate
 }
 
+VECTORIZED_INTERPOLATIONS = {
+    'quadratic': quadratic_kernel,
+    'cubic': cubic_kernel,
+    'hermite': hermite_kernel,
+    'lagrange': lagrange_kernel,
+    'trigonometric': trigonometric_kernel
+}
+
+
+# Interpolated x and y arrays of the last interpolated series
+interpolation_cache = LRUCache(32)
+
+
+def _fingerprint(values):
+    """Get a digest of a sequence of numbers"""
+    from hashlib import blake2b
+    return blake2b(array('d', values).tobytes(), digest_size=16).digest()
+
+
+def interpolate_arrays(kind, x, y, precision=250, **kwargs):
+    """
+    Interpolate x, y with the `kind` interpolation and return
+    the interpolated x and y as two float arrays.
+
+    The vectorized kernel is used when numpy is available.
+    The arrays are cached and shared: they must not be modified.
+    """
+    try:
+        key = (
+            kind, _fingerprint(x), _fingerprint(y),
+            tuple(precision) if is_list_like(precision) else precision,
+            tuple(sorted(kwargs.items()))
+        )
+        hash(key)
+    except TypeError:
+        # Not numbers or unhashable parameters
+        return _interpolate_arrays(kind, x, y, precision, **kwargs)
+
+    arrays = interpolation_cache.get(key)
+    if arrays is None:
+        arrays = interpolation_cache[key] = _interpolate_arrays(
+            kind, x, y, precision, **kwargs
+        )
+    return arrays
+
+
+def _interpolate_arrays(kind, x, y, precision=250, **kwargs):
+    """Interpolate x, y, see interpolate_arrays"""
+    numpy = _numpy()
+    kernel = VECTORIZED_INTERPOLATIONS.get(kind)
+    if numpy is None or kernel is None or len(x) < 2:
+        points = list(INTERPOLATIONS[kind](x, y, precision, **kwargs))
+        return (
+            array('d', map(itemgetter(0), points)),
+            array('d', map(itemgetter(1), points))
+        )
+    xs, ys = kernel(x, y, precision, numpy, **kwargs)
+    return array('d', xs.tobytes()), array('d', ys.tobytes())
+
+
 if __name__ == '__main__':
     from pygal import XY
     points = [(.1, 7), (.3, -4), (.6, 10), (.9, 8), (1.4, 3), (1.7, 1)]
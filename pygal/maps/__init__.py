@@ -17,3 +17,14 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Maps extensions namespace module"""
+
+
+def __getattr__(name):
+    """Load the map plugins on first access to one of them"""
+    if name.startswith('__'):
+        raise AttributeError(name)
+    from pygal import load_plugins
+    load_plugins()
+    if name in globals():
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Render many charts in one html page sharing their css and js"""
+
+from html import escape
+
+# Options the charts are rendered with in a page
+page_options = dict(
+    shared_assets=True, no_prefix=False, disable_xml_declaration=True
+)
+
+
+def render_page(charts, title=None, **kwargs):
+    """
+    Render the given charts in a html5 page.
+
+    Charts are rendered with the shared_assets option: the css of charts
+    having the same style is written once in the page head along with the
+    js and the config of every chart. The page sets the shared_assets,
+    no_prefix and disable_xml_declaration options itself.
+    """
+    forced = sorted(set(kwargs) & set(page_options))
+    if forced:
+        raise TypeError(
+            "render_page() sets the %s option itself" % ', '.join(forced)
+        )
+    pretty_print = kwargs.get('pretty_print', False)
+    options = dict(kwargs, **page_options)
+    styles = {}
+    uris = []
+    configs = []
+    scripts = []
+    svgs = []
+    for chart in charts:
+        chart.setup(**options)
+        try:
+            svg = chart.svg
+            shared_class = svg.css_prefix.strip()[1:]
+            order = chart._order
+            if shared_class not in styles or styles[shared_class][0] < order:
+                all_css, chart_uris = svg.get_styles()
+                styles[shared_class] = order, all_css
+                for uri in chart_uris:
+                    if uri not in uris:
+                        uris.append(uri)
+            configs.append(svg.get_config_script())
+            for script in svg.get_scripts():
+                if script not in scripts:
+                    scripts.append(script)
+            svgs.append(svg.render(is_unicode=True, pretty_print=pretty_print))
+        finally:
+            chart.teardown()
+
+    nl = '\n' if pretty_print else ''
+    head = ['<meta charset="utf-8">']
+    if title is not None:
+        head.append('<title>%s</title>' % escape(title))
+    for uri in uris:
+        head.append('<link rel="stylesheet" href="%s">' % escape(uri))
+    if styles:
+        head.append(
+            '<style>%s</style>' % '\n'.join(
+                css for order, all_css in styles.values() for css in all_css
+            )
+        )
+    if configs:
+        head.append(
+            '<script>%s</script>' % ';\n'.join(configs).replace('</', '<\\/')
+        )
+    for uri, text in scripts:
+        if uri is None:
+            head.append('<script>%s</script>' % text.replace('</', '<\\/'))
+        else:
+            head.append('<script src="%s"></script>' % escape(uri))
+
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>%s%s%s</head>\n<body>%s%s%s</body>\n'
+        '</html>\n'
+    ) % (nl, nl.join(head), nl, nl, nl.join(svgs), nl)
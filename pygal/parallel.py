@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Render many charts in parallel in a process pool"""
+
+import atexit
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import Manager
+
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle = None
+
+# Process pool and manager shared by the async renderings, created when
+# first needed and shut down at exit
+_shared = {}
+
+
+@atexit.register
+def _shutdown():
+    """Shut the shared process pool and manager down"""
+    if 'executor' in _shared:
+        _shared.pop('executor').shutdown()
+    if 'manager' in _shared:
+        _shared.pop('manager').shutdown()
+
+
+def get_executor(executor):
+    """
+    Return the executor to use for async rendering:
+    None or 'thread' for the event loop default thread pool, 'process' for a
+    shared process pool or any concurrent.futures Executor.
+    """
+    if executor is None or isinstance(executor, Executor):
+        return executor
+    if executor == 'thread':
+        return None
+    if executor == 'process':
+        if 'executor' not in _shared:
+            _shared['executor'] = ProcessPoolExecutor()
+        return _shared['executor']
+    raise ValueError(
+        "Invalid value (%r) for executor; "
+        "Use 'thread', 'process' or an Executor instance" % (executor, )
+    )
+
+
+def get_manager():
+    """
+    Return the shared multiprocessing manager, used to tell worker
+    processes that a rendering has been cancelled
+    """
+    if 'manager' not in _shared:
+        _shared['manager'] = Manager()
+    return _shared['manager']
+
+
+def dump_chart(chart):
+    """
+    Pickle the chart spec: its class and its attributes (config,
+    raw_series, uuid, xml filters and any option set on the chart).
+
+    Lambdas or local functions (formatters, filters…) can't be pickled,
+    cloudpickle is used for them when it is installed.
+    """
+    spec = chart.__class__, dict(
+        (k, v) for k, v in chart.__dict__.items()
+        if k not in ('state', '_stream_render')
+    )
+    try:
+        return pickle.dumps(spec, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        if cloudpickle is None:
+            raise ValueError(
+                "Unable to send the %s chart to a worker process (%s). "
+                "Use module level functions instead of lambdas as formatters "
+                "or install cloudpickle." % (chart.__class__.__name__, e)
+            )
+        return cloudpickle.dumps(spec, pickle.HIGHEST_PROTOCOL)
+
+
+def load_chart(data):
+    """Rebuild a chart from a dump_chart pickle"""
+    cls, attributes = pickle.loads(data)
+    chart = cls.__new__(cls)
+    chart.__dict__.update(attributes)
+    chart.__dict__['state'] = None
+    return chart
+
+
+def copy_chart(chart):
+    """
+    Return a copy of the chart sharing its config and values, which can be
+    rendered while the chart itself is rendered or changed
+    """
+    copy = chart.__class__.__new__(chart.__class__)
+    copy.__dict__.update(
+        (k, v) for k, v in chart.__dict__.items()
+        if k not in ('state', '_stream_render')
+    )
+    copy.raw_series = list(chart.raw_series)
+    copy.xml_filters = list(chart.xml_filters)
+    copy.state = None
+    return copy
+
+
+def call_chart(data, method, args, kwargs):
+    """Rebuild a pickled chart and call one of its methods"""
+    return getattr(load_chart(data), method)(*args, **kwargs)
+
+
+def _render(chart, filename, is_unicode, kwargs):
+    """Render one chart to a svg string or to a file"""
+    if filename is None:
+        return chart.render(is_unicode=is_unicode, **kwargs)
+    chart.render_to_file(filename, **kwargs)
+
+
+def _render_chunk(chunk, is_unicode, kwargs):
+    """Render a chunk of pickled charts in a worker process"""
+    return [
+        _render(load_chart(data), filename, is_unicode, kwargs)
+        for data, filename in chunk
+    ]
+
+
+def render_many(
+        charts, workers=None, filenames=None, chunksize=None, min_batch=16,
+        is_unicode=False, **kwargs):
+    """
+    Render the charts in a pool of `workers` processes (defaults to the
+    number of cpus) and return their svg in order.
+
+    If `filenames` is given each chart is written to its file in the
+    workers and nothing is returned.
+    Charts are sent to workers by chunks of `chunksize` (by default 4 chunks
+    per worker). Batches smaller than `min_batch` are rendered in this
+    process since the pool startup would not be worth it.
+    Other keyword arguments are passed to each chart rendering.
+    """
+    charts = list(charts)
+    if filenames is None:
+        filenames = [None] * len(charts)
+    else:
+        filenames = list(filenames)
+        if len(filenames) != len(charts):
+            raise ValueError(
+                'render_many got %d filenames for %d charts' %
+                (len(filenames), len(charts))
+            )
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(charts) < max(min_batch, 2):
+        svgs = [
+            _render(chart, filename, is_unicode, kwargs)
+            for chart, filename in zip(charts, filenames)
+        ]
+    else:
+        if chunksize is None:
+            chunksize = max(1, -(-len(charts) // (4 * workers)))
+        jobs = [(dump_chart(chart), filename)
+                for chart, filename in zip(charts, filenames)]
+        with ProcessPoolExecutor(
+                min(workers, -(-len(jobs) // chunksize))) as executor:
+            futures = [
+                executor.submit(
+                    _render_chunk, jobs[i:i + chunksize], is_unicode, kwargs
+                ) for i in range(0, len(jobs), chunksize)
+            ]
+            svgs = [svg for future in futures for svg in future.result()]
+
+    if not any(filenames):
+        return svgs
@@ -18,21 +18,98 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Serie property holder"""
 
-from pygal.util import cached_property
+from array import array
+from collections import deque
+from operator import itemgetter
 
 
 class Serie(object):
-    """Serie class containing title, values and the graph serie index"""
+    """
+    Serie class containing title, values and the graph serie index.
+    The serie options are read from its config.
+    """
+
+    __slots__ = (
+        'index', 'values', 'config', 'metadata', 'points', 'interpolated',
+        '_safe_values'
+    )
 
     def __init__(self, index, values, config, metadata=None):
         """Create the serie with its options"""
         self.index = index
         self.values = values
         self.config = config
-        self.__dict__.update(config.__dict__)
         self.metadata = metadata or {}
+        self._safe_values = None
+
+    def __getattr__(self, name):
+        """Get a serie option"""
+        if name == 'config' or name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.config, name)
 
-    @cached_property
+    @property
     def safe_values(self):
         """Property containing all values that are not None"""
-        return list(filter(lambda x: x is not None, self.values))
+        if self._safe_values is None:
+            self._safe_values = [
+                value for value in self.values if value is not None
+            ]
+        return self._safe_values
+
+
+class Points(object):
+    """
+    Sequence of the (x, y) points of a serie. Points are built on access
+    from the x positions, shared by the series, and the y values.
+    """
+
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        """Create the points from the x and y columns"""
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Store (x, y) float pairs as two float arrays"""
+        pairs = list(pairs)
+        return cls(
+            array('d', map(itemgetter(0), pairs)),
+            array('d', map(itemgetter(1), pairs))
+        )
+
+    def __len__(self):
+        """Number of points"""
+        return len(self.y)
+
+    def __iter__(self):
+        """Iterate over the points"""
+        return zip(self.x, self.y)
+
+    def __getitem__(self, index):
+        """Get a point or a list of points"""
+        if isinstance(index, slice):
+            return [(self.x[i], self.y[i])
+                    for i in range(len(self.y))[index]]
+        index = range(len(self.y))[index]
+        return self.x[index], self.y[index]
+
+    def __eq__(self, other):
+        """Compare the points with a sequence of points"""
+        return list(self) == list(other)
+
+    # Unhashable like the lists they compare to
+    __hash__ = None
+
+    def __repr__(self):
+        """Represent the points as a list"""
+        return repr(list(self))
+
+
+class Stream(deque):
+    """
+    Values of a live serie (see add_stream) keeping only
+    the `maxlen` last values
+    """
@@ -26,11 +26,28 @@ class State(object):
     Class containing config values
     overriden by chart values
     overriden by keyword args
+
+    During the rendering the state dict is used as the chart dict
+    so that every value is a plain attribute of the chart.
     """
 
+    __slots__ = ('__dict__', 'chart_dict')
+
     def __init__(self, graph, **kwargs):
         """Create the transient state"""
-        merge(self.__dict__, graph.config.__class__.__dict__)
+        self.__dict__.update(graph.config._base)
         merge(self.__dict__, graph.config.__dict__)
         merge(self.__dict__, graph.__dict__)
         merge(self.__dict__, kwargs)
+        self.chart_dict = None
+
+    def bind(self, graph):
+        """Make the state the attributes of graph"""
+        self.chart_dict = graph.__dict__
+        self.state = self
+        graph.__dict__ = self.__dict__
+
+    def unbind(self, graph):
+        """Give graph its own attributes back"""
+        del self.state
+        graph.__dict__ = self.chart_dict
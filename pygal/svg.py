@@ -23,25 +23,54 @@ from __future__ import division
 import io
 import json
 import os
+import re
 from datetime import date, datetime
+from hashlib import md5
 from math import pi
 from numbers import Number
+from tempfile import SpooledTemporaryFile
 from urllib.parse import quote_plus
 
 from pygal import __version__
 from pygal.etree import etree
 from pygal.util import (
+    LRUCache,
     coord_abs_project,
     coord_diff,
     coord_dual,
     coord_format,
     coord_project,
     minify_css,
+    number_format,
+    relative_path,
     template,
 )
 
 nearly_2pi = 2 * pi - .00001
 
+# Templated and minified css, see Svg.add_styles
+css_cache = LRUCache(256)
+
+# Comment marking the chunk bounds and the parked nodes, see Svg.flush
+stream_mark = 'pygal-stream'
+# Size of the parked markup kept in memory before using a temporary file
+spool_size = 2 ** 20
+
+
+def get_style_key(style):
+    """Return a hashable key of the style values"""
+
+    def hashable(value):
+        if isinstance(value, (list, tuple)):
+            return tuple(map(hashable, value))
+        if isinstance(value, (set, frozenset)):
+            return frozenset(value)
+        if isinstance(value, dict):
+            return tuple(sorted((k, hashable(v)) for k, v in value.items()))
+        return value
+
+    return style.__class__, hashable(style.__dict__)
+
 
 class Svg(object):
     """Svg related methods"""
@@ -56,7 +85,25 @@ class Svg(object):
             self.id = '#chart-%s ' % graph.uuid
         else:
             self.id = ''
+        self.css_prefix = self.id
+        classes = list(graph.classes or ())
+        if graph.shared_assets:
+            shared_class = self.get_shared_class()
+            self.css_prefix = '.%s ' % shared_class
+            classes.append(shared_class)
         self.processing_instructions = []
+        self.precision = graph.coordinate_precision
+        if self.precision is not None and (
+                not isinstance(self.precision, int)
+                or isinstance(self.precision, bool) or self.precision < 0):
+            raise ValueError(
+                "Invalid value ({}) for config key 'coordinate_precision';"
+                " Use None or a positive integer".format(self.precision)
+            )
+        if self.precision is None:
+            self.coord_format = '%f'
+        else:
+            self.coord_format = '%.{}f'.format(self.precision)
         if etree.lxml:
             attrs = {'nsmap': {None: self.ns, 'xlink': self.xlink_ns}}
         else:
@@ -68,8 +115,8 @@ class Svg(object):
 
         self.root = etree.Element('svg', **attrs)
         self.root.attrib['id'] = self.id.lstrip('#').rstrip()
-        if graph.classes:
-            self.root.attrib['class'] = ' '.join(graph.classes)
+        if classes:
+            self.root.attrib['class'] = ' '.join(classes)
         self.root.append(
             etree.Comment(
                 'Generated with pygal %s (%s) ©Kozea 2012-2016 on %s' % (
@@ -87,11 +134,43 @@ class Svg(object):
         for def_ in self.graph.defs:
             self.defs.append(etree.fromstring(def_))
 
-    def add_styles(self):
-        """Add the css to the svg"""
-        colors = self.graph.style.get_colors(self.id, self.graph._order)
-        strokes = self.get_strokes()
+        # Called with the svg chunks as they are drawn (see flush)
+        self.stream = graph._svg_writer
+        # Nodes whose start tag has been written
+        self.open_nodes = []
+        # Overlays of the serie being drawn, parked when it's finished
+        self.serie_overlays = ()
+        # (offset, size) of the parked markup in the spool file
+        self.parked = []
+        self.spool = None
+
+    def get_shared_class(self):
+        """
+        Return a css class shared by all the charts which can be styled
+        by the same css (see the shared_assets option)
+        """
+        style = self.graph.style
+        order = self.graph._order
+        key = (
+            get_style_key(style), self.get_strokes(''), tuple(self.graph.css),
+            self.graph.pretty_print,
+            # Colors are darkened according to the number of series
+            # when there are more series than style colors
+            order if order > len(style.colors) else None
+        )
+        return 'pygal-shared-%s' % md5(repr(key).encode('utf-8')
+                                       ).hexdigest()[:12]
+
+    def get_styles(self):
+        """Return the css texts and the uris of the external css"""
+        # Css is cached with a placeholder instead of the chart uuid
+        # so that it can be shared between charts
+        by_id = self.id and self.css_prefix == self.id
+        css_id = '#chart-\x00 ' if by_id else self.css_prefix
+        strokes = self.get_strokes(css_id)
+        style_key = None
         all_css = []
+        uris = []
         auto_css = ['file://base.css']
 
         if self.graph.style._google_fonts:
@@ -104,38 +183,65 @@ class Svg(object):
             css_text = None
             if css.startswith('inline:'):
                 css_text = css[len('inline:'):]
+                if not self.graph.pretty_print:
+                    key = ('inline:', css_text)
+                    minified = css_cache.get(key)
+                    if minified is None:
+                        minified = css_cache[key] = minify_css(css_text)
+                    css_text = minified
             elif css.startswith('file://'):
                 css = css[len('file://'):]
 
                 if not os.path.exists(css):
                     css = os.path.join(os.path.dirname(__file__), 'css', css)
 
-                with io.open(css, encoding='utf-8') as f:
-                    css_text = template(
-                        f.read(),
-                        style=self.graph.style,
-                        colors=colors,
-                        strokes=strokes,
-                        id=self.id
-                    )
+                if style_key is None:
+                    style_key = get_style_key(self.graph.style)
+                key = (
+                    css, os.stat(css).st_mtime_ns, style_key,
+                    self.graph._order, strokes, css_id,
+                    self.graph.pretty_print
+                )
+                css_text = css_cache.get(key)
+                if css_text is None:
+                    with io.open(css, encoding='utf-8') as f:
+                        css_text = template(
+                            f.read(),
+                            style=self.graph.style,
+                            colors=self.graph.style.get_colors(
+                                css_id, self.graph._order
+                            ),
+                            strokes=strokes,
+                            id=css_id
+                        )
+                    if not self.graph.pretty_print:
+                        css_text = minify_css(css_text)
+                    css_cache[key] = css_text
+
+                if by_id:
+                    css_text = css_text.replace('\x00', self.graph.uuid)
 
             if css_text is not None:
-                if not self.graph.pretty_print:
-                    css_text = minify_css(css_text)
                 all_css.append(css_text)
             else:
                 if css.startswith('//') and self.graph.force_uri_protocol:
                     css = '%s:%s' % (self.graph.force_uri_protocol, css)
-                self.processing_instructions.append(
-                    etree.PI('xml-stylesheet', 'href="%s"' % css)
-                )
+                uris.append(css)
+        return all_css, uris
+
+    def add_styles(self):
+        """Add the css to the svg"""
+        all_css, uris = self.get_styles()
+        for css in uris:
+            self.processing_instructions.append(
+                etree.PI('xml-stylesheet', 'href="%s"' % css)
+            )
         self.node(
             self.defs, 'style', type='text/css'
         ).text = '\n'.join(all_css)
 
-    def add_scripts(self):
-        """Add the js to the svg"""
-        common_script = self.node(self.defs, 'script', type='text/javascript')
+    def get_config_script(self):
+        """Return the js declaring the chart config for pygal.js"""
 
         def get_js_dict():
             return dict(
@@ -166,17 +272,44 @@ class Svg(object):
         else:
             common_js += 'window.pygal.config[%r] = ' % self.graph.uuid
 
-        common_script.text = common_js + json.dumps(dct, default=json_default)
+        return common_js + json.dumps(dct, default=json_default)
 
+    def get_scripts(self):
+        """Return the (uri, text) of the js files, text being read if local"""
+        scripts = []
         for js in self.graph.js:
             if js.startswith('file://'):
-                script = self.node(self.defs, 'script', type='text/javascript')
                 with io.open(js[len('file://'):], encoding='utf-8') as f:
-                    script.text = f.read()
+                    scripts.append((None, f.read()))
             else:
                 if js.startswith('//') and self.graph.force_uri_protocol:
                     js = '%s:%s' % (self.graph.force_uri_protocol, js)
-                self.node(self.defs, 'script', type='text/javascript', href=js)
+                scripts.append((js, None))
+        return scripts
+
+    def add_scripts(self):
+        """Add the js to the svg"""
+        common_script = self.node(self.defs, 'script', type='text/javascript')
+        common_script.text = self.get_config_script()
+
+        for uri, text in self.get_scripts():
+            if uri is None:
+                script = self.node(self.defs, 'script', type='text/javascript')
+                script.text = text
+            else:
+                self.node(
+                    self.defs, 'script', type='text/javascript', href=uri
+                )
+
+    def coords(self, *numbers):
+        """Format path coordinates according to coordinate_precision"""
+        return tuple(self.coord_format % n for n in numbers)
+
+    def format(self, value):
+        """Stringify a node value, rounding floats to coordinate_precision"""
+        if self.precision is not None and isinstance(value, float):
+            return number_format(value, self.precision)
+        return str(value)
 
     def node(self, parent=None, tag='g', attrib=None, **extras):
         """Make a new svg node"""
@@ -198,12 +331,14 @@ class Svg(object):
             if value is None:
                 del attrib[key]
 
-            attrib[key] = str(value)
+            attrib[key] = self.format(value)
             if key.endswith('_'):
                 attrib[key.rstrip('_')] = attrib[key]
                 del attrib[key]
             elif key == 'href':
-                attrib[etree.QName('http://www.w3.org/1999/xlink', key)] = attrib[key]
+                attrib[etree.QName(
+                    'http://www.w3.org/1999/xlink', key
+                )] = attrib[key]
                 del attrib[key]
         return etree.SubElement(parent, tag, attrib)
 
@@ -264,7 +399,8 @@ class Svg(object):
 
     def serie(self, serie):
         """Make serie node"""
-        return dict(
+        self.graph._check_cancelled()
+        serie_node = dict(
             plot=self.node(
                 self.graph.nodes['plot'],
                 class_='series serie-%d color-%d' % (serie.index, serie.index)
@@ -278,27 +414,41 @@ class Svg(object):
                 class_='series serie-%d color-%d' % (serie.index, serie.index)
             )
         )
+        if self.stream is not None:
+            # The previous series are finished: write their plot and put
+            # their overlays aside until the overlay layers are written
+            self.flush(serie_node['plot'])
+            for node in self.serie_overlays:
+                self.park(node)
+            self.serie_overlays = (
+                serie_node['overlay'], serie_node['text_overlay']
+            )
+        return serie_node
 
     def line(self, node, coords, close=False, **kwargs):
         """Draw a svg line"""
         line_len = len(coords)
         if len([c for c in coords if c[1] is not None]) < 2:
             return
-        root = 'M%s L%s Z' if close else 'M%s L%s'
         origin_index = 0
         while origin_index < line_len and None in coords[origin_index]:
             origin_index += 1
         if origin_index == line_len:
             return
+        coords = [c for c in coords[origin_index:] if None not in c]
         if self.graph.horizontal:
-            coord_format = lambda xy: '%f %f' % (xy[1], xy[0])
-        else:
-            coord_format = lambda xy: '%f %f' % xy
+            coords = [(y, x) for x, y in coords]
 
-        origin = coord_format(coords[origin_index])
-        line = ' '.join([
-            coord_format(c) for c in coords[origin_index + 1:] if None not in c
-        ])
+        if self.graph.relative_paths:
+            d = 'M%s' % relative_path(coords, self.precision)
+            return self.node(
+                node, 'path', d=d + 'z' if close else d, **kwargs
+            )
+
+        root = 'M%s L%s Z' if close else 'M%s L%s'
+        fmt = '%s %s' % (self.coord_format, self.coord_format)
+        origin = fmt % coords[0]
+        line = ' '.join([fmt % c for c in coords[1:]])
         return self.node(node, 'path', d=root % (origin, line), **kwargs)
 
     def slice(
@@ -306,22 +456,28 @@ class Svg(object):
             center, val, i, metadata
     ):
         """Draw a pie slice"""
+        precision = self.precision
         if angle == 2 * pi:
             angle = nearly_2pi
 
         if angle > 0:
             to = [
-                coord_abs_project(center, radius, start_angle),
-                coord_abs_project(center, radius, start_angle + angle),
-                coord_abs_project(center, small_radius, start_angle + angle),
-                coord_abs_project(center, small_radius, start_angle)
+                coord_abs_project(center, radius, start_angle, precision),
+                coord_abs_project(
+                    center, radius, start_angle + angle, precision
+                ),
+                coord_abs_project(
+                    center, small_radius, start_angle + angle, precision
+                ),
+                coord_abs_project(center, small_radius, start_angle, precision)
             ]
             rv = self.node(
                 node,
                 'path',
                 d='M%s A%s 0 %d 1 %s L%s A%s 0 %d 0 %s z' % (
-                    to[0], coord_dual(radius), int(angle > pi), to[1], to[2],
-                    coord_dual(small_radius), int(angle > pi), to[3]
+                    to[0], coord_dual(radius, precision), int(angle > pi),
+                    to[1], to[2], coord_dual(small_radius, precision),
+                    int(angle > pi), to[3]
                 ),
                 class_='slice reactive tooltip-trigger'
             )
@@ -344,23 +500,23 @@ class Svg(object):
             self, serie_node, start_angle, center, radius, small_radius,
             end_angle, half_pie, max_value
     ):
-
+        precision = self.precision
         if end_angle == 2 * pi:
             end_angle = nearly_2pi
 
         to_shade = [
-            coord_abs_project(center, radius, start_angle),
-            coord_abs_project(center, radius, end_angle),
-            coord_abs_project(center, small_radius, end_angle),
-            coord_abs_project(center, small_radius, start_angle)
+            coord_abs_project(center, radius, start_angle, precision),
+            coord_abs_project(center, radius, end_angle, precision),
+            coord_abs_project(center, small_radius, end_angle, precision),
+            coord_abs_project(center, small_radius, start_angle, precision)
         ]
 
         self.node(
             serie_node['plot'],
             'path',
             d='M%s A%s 0 1 1 %s L%s A%s 0 1 0 %s z' % (
-                to_shade[0], coord_dual(radius), to_shade[1], to_shade[2],
-                coord_dual(small_radius), to_shade[3]
+                to_shade[0], coord_dual(radius, precision), to_shade[1],
+                to_shade[2], coord_dual(small_radius, precision), to_shade[3]
             ),
             class_='gauge-background reactive'
         )
@@ -398,15 +554,18 @@ class Svg(object):
             # Correct text vertical alignment
             middle_radius -= .1 * (radius - small_radius)
             to_labels = [
-                coord_abs_project(center, middle_radius, 0),
-                coord_abs_project(center, middle_radius, nearly_2pi)
+                coord_abs_project(center, middle_radius, 0, precision),
+                coord_abs_project(
+                    center, middle_radius, nearly_2pi, precision
+                )
             ]
             self.node(
                 self.defs,
                 'path',
                 id='valuePath-%s%s' % center,
                 d='M%s A%s 0 1 1 %s' %
-                (to_labels[0], coord_dual(middle_radius), to_labels[1])
+                (to_labels[0], coord_dual(middle_radius, precision),
+                 to_labels[1])
             )
             text_ = self.node(serie_node['text_overlay'], 'text')
             self.node(
@@ -425,23 +584,29 @@ class Svg(object):
             center, val, i, metadata, half_pie, end_angle, max_value
     ):
         """Draw a solid gauge slice and background slice"""
+        precision = self.precision
         if angle == 2 * pi:
             angle = nearly_2pi
 
         if angle > 0:
             to = [
-                coord_abs_project(center, radius, start_angle),
-                coord_abs_project(center, radius, start_angle + angle),
-                coord_abs_project(center, small_radius, start_angle + angle),
-                coord_abs_project(center, small_radius, start_angle)
+                coord_abs_project(center, radius, start_angle, precision),
+                coord_abs_project(
+                    center, radius, start_angle + angle, precision
+                ),
+                coord_abs_project(
+                    center, small_radius, start_angle + angle, precision
+                ),
+                coord_abs_project(center, small_radius, start_angle, precision)
             ]
 
             self.node(
                 node,
                 'path',
                 d='M%s A%s 0 %d 1 %s L%s A%s 0 %d 0 %s z' % (
-                    to[0], coord_dual(radius), int(angle > pi), to[1], to[2],
-                    coord_dual(small_radius), int(angle > pi), to[3]
+                    to[0], coord_dual(radius, precision), int(angle > pi),
+                    to[1], to[2], coord_dual(small_radius, precision),
+                    int(angle > pi), to[3]
                 ),
                 class_='slice reactive tooltip-trigger'
             )
@@ -460,9 +625,9 @@ class Svg(object):
 
     def confidence_interval(self, node, x, low, high, width=7):
         if self.graph.horizontal:
-            fmt = lambda xy: '%f %f' % (xy[1], xy[0])
+            fmt = lambda xy: coord_format((xy[1], xy[0]), self.precision)
         else:
-            fmt = coord_format
+            fmt = lambda xy: coord_format(xy, self.precision)
 
         shr = lambda xy: (xy[0] + width, xy[1])
         shl = lambda xy: (xy[0] - width, xy[1])
@@ -488,8 +653,9 @@ class Svg(object):
 
     def pre_render(self):
         """Last things to do before rendering"""
-        self.add_styles()
-        self.add_scripts()
+        if not self.graph.shared_assets:
+            self.add_styles()
+            self.add_scripts()
         self.root.set(
             'viewBox', '0 0 %d %d' % (self.graph.width, self.graph.height)
         )
@@ -508,39 +674,176 @@ class Svg(object):
         )
         no_data.text = self.graph.no_data_text
 
+    def get_prologue(self, args):
+        """Return the xml declaration and processing instructions"""
+        if self.graph.disable_xml_declaration:
+            return b''
+        return b"<?xml version='1.0' encoding='utf-8'?>\n" + b'\n'.join([
+            etree.tostring(pi, **args) for pi in self.processing_instructions
+        ])
+
     def render(self, is_unicode=False, pretty_print=False):
         """Last thing to do before rendering"""
         for f in self.graph.xml_filters:
             self.root = f(self.root)
         args = {'encoding': 'utf-8'}
 
-        svg = b''
         if etree.lxml:
             args['pretty_print'] = pretty_print
 
-        if not self.graph.disable_xml_declaration:
-            svg = b"<?xml version='1.0' encoding='utf-8'?>\n"
-
-        if not self.graph.disable_xml_declaration:
-            svg += b'\n'.join([
-                etree.tostring(pi, **args)
-                for pi in self.processing_instructions
-            ])
-
-        svg += etree.tostring(self.root, **args)
+        svg = self.get_prologue(args) + etree.tostring(self.root, **args)
 
         if self.graph.disable_xml_declaration or is_unicode:
             svg = svg.decode('utf-8')
         return svg
 
-    def get_strokes(self):
+    def copy_path(self, nodes):
+        """Return nested copies of the nodes, without their other children"""
+        copies = []
+        for node in nodes:
+            if copies:
+                copies.append(
+                    etree.SubElement(copies[-1], node.tag, dict(node.attrib))
+                )
+            else:
+                copies.append(
+                    etree.Element(
+                        node.tag, dict(node.attrib), nsmap=node.nsmap
+                    )
+                )
+        return copies
+
+    def flush(self, node=None):
+        """
+        Write everything preceding node in the svg with the stream callback
+        and drop it from the tree, or the rest of the svg if node is None.
+        The written nodes must not change afterwards.
+        """
+        if self.stream is None:
+            return
+        first = not self.open_nodes
+        if first:
+            if node is not None:
+                # The styles and scripts are in the first chunk
+                self.pre_render()
+            self.open_nodes = [self.root]
+        path = list(node.iterancestors())[::-1] if node is not None else []
+        common = 0
+        for open_node, path_node in zip(self.open_nodes, path):
+            if open_node is not path_node:
+                break
+            common += 1
+
+        # lxml serializes the chunk in copies of its open ancestors, between
+        # two marks, to get the same markup as in the whole tree
+        wrappers = self.copy_path(self.open_nodes)
+        top = wrappers[0]
+        if not first:
+            wrappers[-1].append(etree.Comment(stream_mark))
+
+        # Close the nodes which are not ancestors of node
+        for i in range(len(self.open_nodes) - 1, common - 1, -1):
+            open_node = self.open_nodes[i]
+            while len(open_node):
+                wrappers[i].append(open_node[0])
+            if i:
+                self.open_nodes[i - 1].remove(open_node)
+        del wrappers[common:]
+
+        if node is not None:
+            # Open the ancestors of node after their previous children
+            for i in range(common, len(path) + 1):
+                stop = path[i] if i < len(path) else node
+                parent = path[i - 1]
+                while parent[0] is not stop:
+                    wrappers[-1].append(parent[0])
+                if i < len(path):
+                    wrappers.append(
+                        etree.SubElement(
+                            wrappers[-1], stop.tag, dict(stop.attrib)
+                        )
+                    )
+            wrappers[-1].append(etree.Comment(stream_mark))
+
+        pretty_print = self.graph.pretty_print
+        svg = etree.tostring(
+            top, encoding='unicode', pretty_print=pretty_print
+        )
+        mark = '<!--%s-->' % stream_mark
+        start = 0 if first else svg.index(mark) + len(mark)
+        end = len(svg)
+        if node is not None:
+            end = svg.rindex(mark)
+            if pretty_print and not any(
+                    child.tail for wrapper in wrappers for child in wrapper):
+                # Indentation of the end mark
+                end -= 1 + 2 * len(path)
+        svg = svg[start:end]
+        if first:
+            svg = self.get_prologue({
+                'encoding': 'utf-8',
+                'pretty_print': pretty_print
+            }).decode('utf-8') + svg
+        self.open_nodes = path
+        self.write(svg)
+        if node is None and self.spool is not None:
+            self.spool.close()
+
+    def park(self, node):
+        """
+        Serialize a finished node which can't be written yet in the spool
+        file, and replace it with a placeholder comment (see write)
+        """
+        ancestors = list(node.iterancestors())[::-1]
+        wrappers = self.copy_path(ancestors)
+        node.addprevious(
+            etree.Comment('%s-%d' % (stream_mark, len(self.parked)))
+        )
+        wrappers[-1].append(etree.Comment(stream_mark))
+        wrappers[-1].append(node)
+        wrappers[-1].append(etree.Comment(stream_mark))
+        pretty_print = self.graph.pretty_print
+        svg = etree.tostring(
+            wrappers[0], encoding='unicode', pretty_print=pretty_print
+        )
+        mark = '<!--%s-->' % stream_mark
+        indent = ''
+        if pretty_print and not node.tail:
+            indent = '\n' + '  ' * len(ancestors)
+        markup = svg[
+            svg.index(mark) + len(mark) + len(indent):
+            svg.rindex(mark) - len(indent)
+        ].encode('utf-8')
+
+        if self.spool is None:
+            self.spool = SpooledTemporaryFile(spool_size)
+        self.spool.seek(0, io.SEEK_END)
+        self.parked.append((self.spool.tell(), len(markup)))
+        self.spool.write(markup)
+
+    def write(self, svg):
+        """Write svg with the stream callback, with the parked markup"""
+        parts = re.split(r'<!--%s-(\d+)-->' % stream_mark, svg)
+        for i, part in enumerate(parts):
+            if i % 2:
+                offset, size = self.parked[int(part)]
+                self.spool.seek(offset)
+                chunk = self.spool.read(size).decode('utf-8')
+            else:
+                chunk = part
+            if chunk:
+                self.stream(chunk)
+
+    def get_strokes(self, prefix=None):
         """Return a css snippet containing all stroke style options"""
+        if prefix is None:
+            prefix = self.css_prefix
 
         def stroke_dict_to_css(stroke, i=None):
             """Return a css style for the given option"""
             css = [
                 '%s.series%s {\n' %
-                (self.id, '.serie-%d' % i if i is not None else '')
+                (prefix, '.serie-%d' % i if i is not None else '')
             ]
             for key in ('width', 'linejoin', 'linecap', 'dasharray',
                         'dashoffset'):
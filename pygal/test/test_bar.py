@@ -34,3 +34,29 @@ def test_simple_bar():
     assert len(q(".axis.y")) == 1
     assert len(q(".legend")) == 2
     assert len(q(".plot .series rect")) == 2 * 3
+
+
+def test_bar_clipping():
+    """Test that bars out of range are cut"""
+    bar = Bar(range=(10, 20))
+    bar.add('test', [5, 15, 30])
+    q = bar.render_pyquery()
+    rects = q(".plot .series rect")
+    assert len(rects) == 3
+    height = float(q(".plot .background")[0].get('height'))
+    for rect in rects:
+        assert float(rect.get('y')) >= 0
+        assert float(rect.get('y')) + float(rect.get('height')) <= height
+
+
+def test_bar_spacing():
+    """Test that custom spacing moves the bars apart"""
+    bar = Bar(bar_spacing=[3, 0, 1])
+    bar.add('test', [1, 2, 3, 4, 5])
+    rects = bar.render_pyquery()(".plot .series rect")
+    xs = [float(rect.get('x')) for rect in rects]
+    widths = set(rect.get('width') for rect in rects)
+    assert len(widths) == 1
+    gaps = [x2 - x1 for x1, x2 in zip(xs, xs[1:])]
+    assert gaps[0] > gaps[2] > gaps[1]
+    assert abs(gaps[3] - gaps[1]) < 1e-3
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Typed columns tests"""
+
+import sys
+from array import array
+from functools import reduce
+
+import pytest
+
+from pygal.adapters import none_to_zero, not_zero, positive
+from pygal.columns import as_column, column_to_list, is_column
+from pygal.util import compose, ident
+
+numpy = pytest.importorskip('numpy')
+
+
+def test_is_column():
+    """Test typed columns detection"""
+    assert is_column(numpy.arange(3))
+    assert is_column(array('d', [1, 2]))
+    assert is_column(memoryview(array('i', [1, 2])))
+    assert not is_column([1, 2])
+    assert not is_column((1, 2))
+    assert not is_column(b'12')
+    assert not is_column({'a': 1})
+
+
+def test_as_column():
+    """Test columns are not copied"""
+    values = numpy.arange(3.)
+    assert as_column(values) is values
+    assert as_column(array('d', [1, 2])).dtype == numpy.float64
+    assert as_column(numpy.float64(2)) == [2.]
+    assert as_column(numpy.array(['a', 'b'])) == ['a', 'b']
+
+
+def chain(adapters):
+    """Compose adapters given in application order"""
+    return reduce(compose, reversed(adapters), ident)
+
+
+def test_column_to_list():
+    """Test vectorized adapters give the same values as the adapters"""
+    raw = [1.5, float('nan'), -2., 0., 3.]
+    for adapters in ((), (positive, ), (not_zero, ), (none_to_zero, ), (
+            not_zero, positive), (positive, not_zero), (
+                none_to_zero, positive, not_zero), (str, positive)):
+        values, remaining = column_to_list(numpy.array(raw), adapters)
+        values = list(map(chain(remaining), values))
+        expected = [chain(adapters)(None if v != v else v) for v in raw]
+        assert repr(values) == repr(expected)
+
+
+def test_column_to_list_2d():
+    """Test conversion of two dimensional columns"""
+    values, _ = column_to_list(numpy.array([[1, numpy.nan], [3, 4]]))
+    assert values == [[1., None], [3., 4.]]
+
+
+def test_column_to_list_without_numpy(monkeypatch):
+    """Test columns conversion without numpy"""
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    column = as_column(array('d', [1, float('nan')]))
+    assert isinstance(column, memoryview)
+    values, remaining = column_to_list(column, (positive, ))
+    assert values == [1., None]
+    assert remaining == [positive]
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Decimations tests"""
+
+from math import sin
+
+import pytest
+
+from pygal import XY, Line
+from pygal.decimate import DECIMATIONS, decimate
+from pygal.test import make_data
+
+points = [(i / 10, sin(i / 7) * 100) for i in range(10000)]
+
+
+@pytest.mark.parametrize('method', sorted(DECIMATIONS))
+def test_decimate_bounded(method):
+    """Test that decimation keeps a few points per pixel"""
+    kept = decimate(points, method)
+    assert kept == sorted(set(kept))
+    assert kept[0] == 0 and kept[-1] == len(points) - 1
+    assert len(kept) <= 4 * (points[-1][0] + 1)
+    assert len(kept) < len(points)
+
+
+def test_decimate_extremes():
+    """Test that m4 and min_max keep each pixel extremes"""
+    for method in ('m4', 'min_max'):
+        kept = [points[i] for i in decimate(points, method)]
+        assert max(y for x, y in kept) == max(y for x, y in points)
+        assert min(y for x, y in kept) == min(y for x, y in points)
+
+
+def test_decimate_none():
+    """Test that None points are kept to preserve interruptions"""
+    values = points[:3000] + [(300, None)] + points[3001:]
+    kept = decimate(values, 'lttb')
+    assert 3000 in kept
+    assert 2999 in kept and 3001 in kept
+    assert decimate([(None, None), (1, 2)], 'm4') == [0, 1]
+
+
+def test_decimate_small():
+    """Test that sparse points are all kept"""
+    few = [(i * 100, i) for i in range(8)]
+    for method in DECIMATIONS:
+        assert decimate(few, method) == list(range(8))
+
+
+def test_decimate_unsorted():
+    """Test that runs of points not sorted along x are drawn in x order"""
+    shuffled = points[::2] + points[1::2]
+    for method in DECIMATIONS:
+        kept = [shuffled[i][0] for i in decimate(shuffled, method)]
+        assert kept == sorted(kept)
+        assert kept[0] == 0 and kept[-1] == points[-1][0]
+        assert len(kept) < len(points)
+
+
+def test_decimate_invalid():
+    """Test that an unknown decimation raises a ValueError"""
+    with pytest.raises(ValueError):
+        decimate(points, 'foo')
+    line = Line(decimate='foo')
+    line.add('sin', [1, 2, 3])
+    with pytest.raises(ValueError):
+        line.render()
+
+
+def test_decimate_chart(Chart, datas):
+    """Test decimation in all charts"""
+    chart = Chart(decimate='lttb')
+    chart = make_data(chart, datas)
+    assert chart.render()
+
+
+def test_decimate_line():
+    """Test that decimation bounds dots but not the scale"""
+    values = [sin(i / 100) for i in range(20000)]
+    values[12345] = 10
+    line = Line(decimate='m4', width=400)
+    line.add('sin', values)
+    q = line.render_pyquery()
+    assert len(q('.dots')) < 4 * 400
+    assert '10' in [t.text for t in q('.axis.y text')]
+    path = q('.line')[0].get('d')
+    assert len(path.split(' ')) < 8 * 400
+
+    xy = XY(decimate='min_max', width=400)
+    xy.add('xy', [(i, v) for i, v in enumerate(values)])
+    assert len(xy.render_pyquery()('.dots')) <= 2 * 400
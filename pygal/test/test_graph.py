@@ -18,22 +18,69 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Generate tests for different chart types with different data"""
 
+import asyncio
+import base64
+import gzip
 import io
 import os
+import re
+import threading
+import time
 import uuid
+from array import array
+from concurrent.futures import (
+    CancelledError,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from decimal import Decimal
+from functools import reduce
 
 import pytest
 
 import pygal
+from pygal import Config
+from pygal.adapters import (
+    compile_adapters,
+    decimal_to_float,
+    none_to_zero,
+    not_zero,
+    positive,
+)
 from pygal.graph.map import BaseMap
+from pygal.parallel import get_manager
 from pygal.test import make_data
-from pygal.util import cut
+from pygal.util import compose, cut, ident
 
 try:
     import cairosvg
 except ImportError:
     cairosvg = None
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def bracket_formatter(value):
+    """Module level formatter which can be sent to worker processes"""
+    return '<%s>' % value
+
+
+class SlowFormatter(object):
+    """Formatter telling when it is first called and taking its time"""
+
+    def __init__(self, started):
+        """Set the event to set on the first call"""
+        self.started = started
+
+    def __call__(self, value):
+        """Format the value slowly"""
+        self.started.set()
+        time.sleep(.01)
+        return str(value)
+
 
 def test_multi_render(Chart, datas):
     """Check that a chart always render the same"""
@@ -58,6 +105,262 @@ def test_render_to_file(Chart, datas):
     os.remove(file_name)
 
 
+def test_render_gzip(Chart, datas):
+    """Test gzip compressed rendering"""
+    chart = Chart()
+    chart = make_data(chart, datas)
+    svg = chart.render()
+    assert gzip.decompress(chart.render_gzip()) == svg
+    assert gzip.decompress(b''.join(chart.render_gzip_iter())) == svg
+
+    file_name = '/tmp/test_graph-%s.svgz' % uuid.uuid4()
+    chart.render_to_file(file_name)
+    with gzip.open(file_name) as f:
+        assert f.read() == svg
+    os.remove(file_name)
+
+    uri = chart.render_data_uri(gzip=True)
+    assert uri.startswith('data:image/svg+xml-compressed;base64,')
+    assert b'pygal' in gzip.decompress(
+        base64.b64decode(uri.split(',', 1)[1])
+    )
+
+
+def test_render_iter(Chart, datas):
+    """Test chunked rendering"""
+    chart = Chart()
+    chart = make_data(chart, datas)
+    svg = chart.render()
+    assert b''.join(chart.render_iter()) == svg
+    assert ''.join(chart.render_iter(is_unicode=True)) == svg.decode('utf-8')
+
+
+def test_render_iter_pretty_print():
+    """Test chunked rendering with pretty print and external css"""
+    chart = pygal.Line(
+        pretty_print=True, css=['https://example.com/style.css']
+    )
+    chart.add('serie', [1, 3, 2])
+    assert b''.join(chart.render_iter()) == chart.render()
+
+
+def test_render_iter_close(Chart, datas):
+    """Test that an abandoned chunked rendering tears down the state"""
+    chart = Chart()
+    chart = make_data(chart, datas)
+    chunks = chart.render_iter()
+    next(chunks)
+    chunks.close()
+    assert chart.state is None
+
+
+def test_render_iter_series():
+    """Test that each serie is written while the next ones are drawn"""
+    formatted = []
+
+    def formatter(value):
+        formatted.append(value)
+        return str(value)
+
+    chart = pygal.Line(formatter=formatter)
+    for i in range(4):
+        chart.add(str(i), [10 * i + 1, 10 * i + 2])
+    svg = chart.render()
+    del formatted[:]
+    chunks = chart.render_iter()
+    first = next(chunks)
+    assert first.startswith(b'<?xml')
+    assert b'serie-0' not in first
+    assert 31 not in formatted
+    assert chart.state is not None
+    rest = list(chunks)
+    assert 31 in formatted
+    assert len(rest) > 4
+    assert first + b''.join(rest) == svg
+
+
+def test_render_iter_error():
+    """Test that an error while drawing is raised by the chunked rendering"""
+
+    def formatter(value):
+        raise ZeroDivisionError()
+
+    chart = pygal.Line(formatter=formatter)
+    chart.add('serie', [1, 2])
+    chart.add('serie', [3, 4])
+    with pytest.raises(ZeroDivisionError):
+        list(chart.render_iter())
+    assert chart.state is None
+
+
+def test_render_state(Chart, datas):
+    """Test config precedence and chart attributes during rendering"""
+    seen = []
+
+    def formatter(value):
+        seen.append((chart.title, chart.state is not None))
+        return str(value)
+
+    chart = Chart(title='config', value_formatter=formatter)
+    chart = make_data(chart, datas)
+    chart.render()
+    assert set(seen) <= {('config', True)}
+    chart.title = 'chart'
+    del seen[:]
+    chart.render()
+    assert set(seen) <= {('chart', True)}
+    del seen[:]
+    chart.render(title='kwargs')
+    assert set(seen) <= {('kwargs', True)}
+    assert chart.title == 'chart'
+    assert chart.state is None
+    assert 'view' not in chart.__dict__
+
+
+def test_config_copy_on_write():
+    """Test that configs only hold their own values"""
+    config = Config(title='t')
+    assert config.__dict__ == {'title': 't'}
+    assert config.width == 800
+    config.css.append('file://custom.css')
+    assert Config().css == list(Config.css.value)
+
+    copy = config.copy()
+    copy.css.append('file://other.css')
+    copy.title = 'c'
+    assert config.title == 't'
+    assert config.css[-1] == 'file://custom.css'
+
+    class SmallConfig(Config):
+        width = 200
+
+    small = SmallConfig()
+    SmallConfig.width = 100
+    assert small.width == 200
+    assert SmallConfig().width == 100
+    assert b'viewBox="0 0 200 600"' in pygal.Line(small).render()
+    assert b'viewBox="0 0 100 600"' in pygal.Line(SmallConfig).render()
+
+
+def test_coordinate_precision(Chart, datas):
+    """Test that coordinates are rounded to coordinate_precision"""
+    chart = Chart(coordinate_precision=2)
+    chart = make_data(chart, datas)
+    q = chart.render_pyquery()
+    too_precise = re.compile(r'\.\d{3}')
+    for node in q('.plot path, .plot rect, .plot circle'):
+        for key in ('d', 'x', 'y', 'width', 'height', 'cx', 'cy'):
+            assert not too_precise.search(node.get(key, '')), node.get(key)
+    for desc in q('desc.x, desc.y'):
+        assert not too_precise.search(desc.text)
+
+    chart.relative_paths = True
+    relative = chart.render()
+    assert len(relative) <= len(chart.render(relative_paths=False))
+    with pytest.raises(ValueError):
+        chart.render(coordinate_precision=-1)
+    with pytest.raises(ValueError):
+        chart.render(coordinate_precision=True)
+
+
+def test_render_async(Chart, datas):
+    """Test asynchronous rendering in threads"""
+    chart = Chart()
+    chart = make_data(chart, datas)
+    svg = chart.render()
+    assert asyncio.run(chart.render_async()) == svg
+    with ThreadPoolExecutor(1) as executor:
+        assert asyncio.run(
+            chart.render_async(is_unicode=True, executor=executor)
+        ) == svg.decode('utf-8')
+
+    file_name = '/tmp/test_graph-%s.svg' % uuid.uuid4()
+    asyncio.run(chart.render_to_file_async(file_name, executor='thread'))
+    with io.open(file_name, encoding='utf-8') as f:
+        assert f.read() == svg.decode('utf-8')
+    os.remove(file_name)
+
+
+def test_render_async_concurrent():
+    """Test concurrent asynchronous renderings of the same chart"""
+    chart = pygal.Line(value_formatter=SlowFormatter(threading.Event()))
+    chart.add('1', [1, 2, 3])
+    svg = chart.render()
+
+    async def render_all():
+        return await asyncio.gather(*[
+            chart.render_async(title=str(i), executor=executor)
+            for i in range(4)
+        ])
+
+    with ThreadPoolExecutor(4) as executor:
+        svgs = asyncio.run(render_all())
+    for i, rendered in enumerate(svgs):
+        assert rendered == chart.render(title=str(i))
+    assert chart.render() == svg
+    assert chart.state is None
+
+
+def test_render_async_process():
+    """Test asynchronous rendering in a process pool"""
+    chart = pygal.Line(value_formatter=bracket_formatter)
+    chart.add('1', [1, 2, 3])
+    assert asyncio.run(chart.render_async(executor='process')
+                       ) == chart.render()
+    with pytest.raises(ValueError):
+        asyncio.run(chart.render_async(executor='fiber'))
+
+
+def test_render_async_cancel():
+    """Test that cancelling an asynchronous rendering stops it"""
+    chart = pygal.Line()
+    chart.add('1', [1, 2, 3])
+    cancelled = threading.Event()
+    cancelled.set()
+    with pytest.raises(CancelledError):
+        chart.render(_cancelled=cancelled)
+    assert chart.state is None
+
+    async def cancel():
+        with ThreadPoolExecutor(1) as executor:
+            # Keep the only worker busy so that the rendering is pending
+            busy = threading.Event()
+            executor.submit(busy.wait)
+            task = asyncio.ensure_future(chart.render_async(executor=executor))
+            await asyncio.sleep(.01)
+            task.cancel()
+            busy.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(cancel())
+    assert chart.state is None
+
+
+def test_render_async_process_cancel():
+    """Test that cancelling a rendering in a process stops the worker"""
+    started = get_manager().Event()
+    chart = pygal.Line(value_formatter=SlowFormatter(started))
+    for i in range(100):
+        chart.add(str(i), list(range(10)))
+
+    async def cancel():
+        with ProcessPoolExecutor(1) as executor:
+            task = asyncio.ensure_future(chart.render_async(executor=executor))
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait
+            )
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # The whole rendering would take 10 seconds
+            start = time.time()
+            assert executor.submit(abs, -1).result() == 1
+            assert time.time() - start < 5
+
+    asyncio.run(cancel())
+
+
 @pytest.mark.skipif(not cairosvg, reason="CairoSVG not installed")
 def test_render_to_png(Chart, datas):
     """Test in file png rendering"""
@@ -214,6 +517,24 @@ def test_iterable_types(Chart):
     assert chart1 == chart2
 
 
+def test_column_types(Chart):
+    """Test serie as numpy array and array.array with nan as missing"""
+    def render(values):
+        chart = Chart(no_prefix=True)
+        chart.uuid = 'uuid'
+        chart.add('A', values)
+        chart.add('B', [1, 2, 3, 4])
+        return chart.render()
+
+    assert render(array('d', [1, float('nan'), -2])) == render([1, None, -2])
+    assert render(array('i', [1, 0, -2])) == render([1, 0, -2])
+    if numpy is not None:
+        assert render(numpy.array([1.5, numpy.nan, 0, -2])) == render(
+            [1.5, None, 0., -2.]
+        )
+        assert render(numpy.arange(3)) == render([0, 1, 2])
+
+
 def test_values_by_dict(Chart):
     """Test serie as dict"""
     chart1 = Chart(no_prefix=True)
@@ -245,6 +566,76 @@ def test_values_by_dict(Chart):
     assert chart1.render() == chart2.render()
 
 
+def test_values_by_dict_unknown_keys():
+    """Test keys not in x_labels are reported at once"""
+    chart = pygal.Bar()
+    chart.x_labels = 'red', 'green'
+    chart.add('A', {'red': 1, 'blue': 2})
+    chart.add('B', dict(('key%d' % i, i) for i in range(12)))
+    chart.add('C', {'green': 3})
+    with pytest.warns(Warning) as record:
+        chart.render()
+    assert len(record) == 1
+    message = str(record[0].message)
+    assert "A: 'blue'" in message
+    assert "B: 'key0'" in message
+    assert "'key9' and 2 more" in message
+    assert 'C:' not in message
+
+
+def test_extend_x_labels():
+    """Test x_labels extended with the dict series keys"""
+    chart1 = pygal.Line(extend_x_labels=True, no_prefix=True)
+    chart1.x_labels = ['red']
+    chart1.add('A', {'red': 1, 'green': 2})
+    chart1.add('B', {'blue': 3, 'green': 4})
+
+    chart2 = pygal.Line(extend_x_labels=True, no_prefix=True)
+    chart2.x_labels = ['red', 'green', 'blue']
+    chart2.add('A', [1, 2])
+    chart2.add('B', [None, 4, 3])
+
+    assert chart1.render() == chart2.render()
+    assert chart1.x_labels == ['red']
+
+
+def test_compile_adapters():
+    """Test compiled adapters match the composed ones"""
+    for adapters in ([ident], [none_to_zero, decimal_to_float], [
+            ident, positive, not_zero, decimal_to_float
+    ], [positive, none_to_zero, positive, not_zero, decimal_to_float]):
+        adapt = compile_adapters(adapters)
+        for value in (None, 0, -0., -2, 3.5, Decimal('-1.5'), 'a'):
+            assert adapt(value) == reduce(compose, adapters)(value)
+
+
+@pytest.mark.parametrize('logarithmic', [False, True])
+def test_numbers_adapted_at_once(Chart, logarithmic):
+    """Test series of numbers are adapted like the other ones"""
+    if issubclass(Chart, BaseMap):
+        return
+    numbers = [4, 0, -2.5, 1.25, -3, 6]
+    if Chart.__name__ == 'Histogram':
+        series = [(abs(n) + 1, i, i + 1) for i, n in enumerate(numbers)]
+        mixed = series[:-1] + [(7, 5, Decimal(6))]
+    elif Chart._dual:
+        series = list(enumerate(numbers))
+        mixed = series[:-1] + [(5, Decimal(6))]
+    else:
+        series = numbers
+        mixed = series[:-1] + [Decimal(6)]
+
+    values = []
+    for serie in (series, mixed):
+        chart = Chart(logarithmic=logarithmic)
+        chart.x_labels = map(str, range(8))
+        chart.add('numbers', serie)
+        chart.setup()
+        values.append(chart.series[0].values)
+        chart.teardown()
+    assert values[0] == values[1]
+
+
 def test_no_data_with_no_values(Chart):
     """Test no data"""
     chart = Chart()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Import time tests"""
+
+import os
+import subprocess
+import sys
+
+import pygal
+
+
+def imported(code):
+    """Return the heavy modules imported by code in a fresh interpreter"""
+    code += (
+        '\nimport sys\nprint(" ".join(sorted(m for m in sys.modules if '
+        'm.startswith("pygal.graph") or m in '
+        '("importlib_metadata", "pandas", "asyncio"))))'
+    )
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.path.dirname(os.path.dirname(pygal.__file__))
+    )
+    return subprocess.check_output([sys.executable, '-c', code],
+                                   env=env).decode('utf-8').split()
+
+
+def test_lazy_import():
+    """Test that importing pygal doesn't import charts nor plugins"""
+    assert imported('import pygal') == []
+
+
+def test_lazy_chart_import():
+    """Test that charts are imported on first access"""
+    modules = imported('from pygal import Line')
+    assert 'pygal.graph.line' in modules
+    assert 'pygal.graph.bar' not in modules
+    assert 'importlib_metadata' not in modules
+
+
+def test_lazy_plugins():
+    """Test that plugins are loaded on first access to the charts list"""
+    assert 'importlib_metadata' in imported('import pygal; pygal.CHARTS')
+    assert pygal.CHARTS_BY_NAME['Line'] is pygal.Line
+    assert 'Line' in dir(pygal)
+
+
+def test_plugins_retry():
+    """Test that plugins are loaded again when loading them failed"""
+    code = (
+        'import importlib_metadata, pygal\n'
+        'entry_points = importlib_metadata.entry_points\n'
+        'def fail(**kwargs):\n'
+        '    importlib_metadata.entry_points = entry_points\n'
+        '    raise RuntimeError()\n'
+        'importlib_metadata.entry_points = fail\n'
+        'try:\n'
+        '    pygal.CHARTS\n'
+        'except RuntimeError:\n'
+        '    pass\n'
+        'pygal.CHARTS\n'
+    )
+    assert 'pygal.graph.line' in imported(code)
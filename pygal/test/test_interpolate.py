@@ -18,8 +18,31 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Interpolations tests"""
 
+import sys
+
+import pytest
+
+from pygal import Line
+from pygal.interpolate import (
+    INTERPOLATIONS,
+    VECTORIZED_INTERPOLATIONS,
+    interpolate_arrays,
+    interpolation_cache,
+)
 from pygal.test import make_data
 
+KERNELS_PARAMETERS = [
+    ('quadratic', {}),
+    ('cubic', {}),
+    ('lagrange', {}),
+    ('trigonometric', {}),
+    ('hermite', {}),
+    ('hermite', {'type': 'finite_difference'}),
+    ('hermite', {'type': 'catmull_rom'}),
+    ('hermite', {'type': 'cardinal', 'c': .75}),
+    ('hermite', {'type': 'kochanek_bartels', 'b': -1, 'c': 1, 't': .5}),
+]
+
 
 def test_cubic(Chart, datas):
     """Test cubic interpolation"""
@@ -137,3 +160,84 @@ def test_hermite_kochanek_bartels(Chart, datas):
     )
     chart = make_data(chart, datas)
     assert chart.render()
+
+
+@pytest.mark.parametrize('kind, parameters', KERNELS_PARAMETERS)
+def test_vectorized_kernels(kind, parameters):
+    """Test vectorized kernels give exactly the interpolated points"""
+    numpy = pytest.importorskip('numpy')
+    for x, y in (
+            ([0, 1, 2, 3], [1, 5, -3, 8]),
+            ([.1, .3, .3, .9, 1.4, 1.7], [7, -4.5, 10, 8.25, 3, 1e3]),
+            ([-2, 4.5], [0, 1])):
+        for precision in (1, 3, 250, [k % 5 + 1 for k in range(len(x) - 1)]):
+            points = list(INTERPOLATIONS[kind](x, y, precision, **parameters))
+            xs, ys = VECTORIZED_INTERPOLATIONS[kind](
+                x, y, precision, numpy, **parameters
+            )
+            assert list(zip(xs.tolist(), ys.tolist())) == points
+
+
+def test_interpolate_arrays_without_numpy(monkeypatch):
+    """Test interpolation falls back on the generators without numpy"""
+    points = list(INTERPOLATIONS['cubic']([0, 1, 2], [1, 5, -3], 10))
+    xs, ys = interpolate_arrays('cubic', [0, 1, 2], [1, 5, -3], 10)
+    assert list(zip(xs, ys)) == points
+    interpolation_cache.clear()
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    assert interpolate_arrays('cubic', [0, 1, 2], [1, 5, -3], 10) == (xs, ys)
+    assert interpolation_cache.misses == 1
+
+
+def test_interpolation_cache():
+    """Test interpolated series are cached by content"""
+    interpolation_cache.clear()
+    chart = Line(interpolate='cubic')
+    chart.add('a', [1, 5, -3, 4])
+    chart.add('b', [2, 2, 3])
+    svg = chart.render()
+    assert (interpolation_cache.hits, interpolation_cache.misses) == (0, 2)
+    chart.show_legend = False
+    chart.render()
+    assert (interpolation_cache.hits, interpolation_cache.misses) == (2, 2)
+    chart.show_legend = True
+    assert chart.render() == svg
+    chart.width = 400
+    chart.render()
+    assert (interpolation_cache.hits, interpolation_cache.misses) == (6, 2)
+    chart.interpolate = 'hermite'
+    chart.render()
+    assert interpolation_cache.misses == 4
+    chart.interpolation_parameters = {'type': 'cardinal', 'c': .5}
+    chart.render()
+    assert interpolation_cache.misses == 6
+    # Same content as 'a'
+    chart.add('c', [1, 5, -3, 4.])
+    chart.render()
+    assert (interpolation_cache.hits, interpolation_cache.misses) == (9, 6)
+
+
+def test_interpolation_density():
+    """Test interpolated points are distributed by segment length"""
+    chart = Line(
+        interpolate='cubic', interpolation_density=1, width=400,
+        show_dots=False
+    )
+    chart.add('flat', [1, 1, 1, 1, 1])
+    chart.add('steep', [0, 100, 0, 0, 0])
+    q = chart.render_pyquery()
+    flat, steep = [
+        [float(x) for x in path.get('d')[1:].replace('L', '').split()[::2]]
+        for path in q('.line.reactive')
+    ]
+    assert 400 <= len(flat) <= 400 + 5
+    # Most of the points are in the steep segments
+    middle = (steep[0] + steep[-1]) / 2
+    assert len([x for x in steep if x < middle]) > 2 * len(
+        [x for x in steep if x > middle]
+    )
+
+    chart.add('long', list(range(1000)))
+    q = chart.render_pyquery()
+    # Less points than segments: nothing to interpolate
+    assert len(q('.line.reactive')[-1].get('d').split(' ')) == 2 * 1000
@@ -22,7 +22,8 @@ from __future__ import division
 
 from math import cos, sin
 
-from pygal import Line
+from pygal import XY, Line
+from pygal.parallel import dump_chart, load_chart
 from pygal.test.utils import texts
 
 
@@ -172,3 +173,140 @@ def test_line_secondary():
     assert len(q(".plot .series path")) == 2
     assert len(q(".x.axis .guides")) == 0
     assert len(q(".y.axis .guides")) == 7
+
+
+def test_line_clipping():
+    """Test that values out of range are clipped"""
+    line = Line(range=(0, 10))
+    line.add('test', [5, 8, 50, 40, 7, 3])
+    q = line.render_pyquery()
+    assert len(q(".dots")) == 4
+    paths = q(".plot .series path")
+    assert len(paths) == 2
+    height = float(q(".plot .background")[0].get('height'))
+    for path in paths:
+        for y in path.get('d')[1:].replace('L', '').split()[1::2]:
+            assert 0 <= float(y) <= height
+
+
+def test_line_logarithmic():
+    """Test that non positive values are missing in logarithmic lines"""
+    line = Line(logarithmic=True, show_dots=False)
+    line.add('test', [1, 10, 0, 100, 100, -1, 10, 1])
+    q = line.render_pyquery()
+    paths = q(".plot .series path")
+    assert len(paths) == 1
+    assert len(paths[0].get('d')[1:].replace('L', '').split()) == 2 * 6
+
+    line.allow_interruptions = True
+    assert len(line.render_pyquery()(".plot .series path")) == 3
+
+    line.fill = True
+    line.allow_interruptions = False
+    q = line.render_pyquery()
+    # The two fill points are added
+    assert len(
+        q(".plot .series path")[0].get('d')[1:].replace('L', '').split()
+    ) == 2 * 8
+
+
+def test_xy_clipping():
+    """Test that xy values out of xrange are culled"""
+    xy = XY(xrange=(100, 200), interpolate='cubic')
+    xy.add('test', [(x, sin(x / 10)) for x in range(1000)])
+    q = xy.render_pyquery()
+    # 101 values in range plus the box margin
+    assert 101 <= len(q(".dots")) <= 105
+    assert len(q(".plot .series path")) == 1
+
+
+def test_xy_clipping_interpolation(monkeypatch):
+    """Test that the visible interpolated lines fit in the xrange box"""
+    monkeypatch.setenv('PYGAL_KEEP_STATE', '1')
+    xy = XY(xrange=(0, 10), interpolate='cubic')
+    xy.add('test', [(0, 0), (1, 10), (2, 0), (3, 10), (4, 0)])
+    xy.render()
+    assert xy._box.ymax >= max(y for x, y in xy.series[0].interpolated)
+    assert xy._box.ymin <= min(y for x, y in xy.series[0].interpolated)
+
+    xy = XY(xrange=(0, 10), interpolate='cubic')
+    xy.add('test', [(None, 1), (None, 2), (None, 3)])
+    assert xy.render()
+
+
+def test_stream():
+    """Test rolling window streams"""
+    line = Line()
+    stream = line.add_stream('test', maxlen=3, values=[1, 2])
+    for value in range(3, 6):
+        stream.append(value)
+    assert list(stream) == [3, 4, 5]
+    q = line.render_pyquery()
+    assert len(q(".dots")) == 3
+    stream.append(6)
+    assert [t.text for t in q(".dots desc.value")] == ['3', '4', '5']
+    q = line.render_pyquery()
+    assert [t.text for t in q(".dots desc.value")] == ['4', '5', '6']
+
+
+def test_stream_redraw(monkeypatch):
+    """Test that streams are redrawn in the previous rendering"""
+    redraws = []
+    redraw = Line._redraw
+
+    def spy(self, changed):
+        redraws.append((changed, redraw(self, changed)))
+        return redraws[-1][1]
+
+    monkeypatch.setattr(Line, '_redraw', spy)
+    line = Line(range=(0, 100))
+    line.add('static', [10, 20, 30])
+    first = line.add_stream('first', maxlen=3, values=[50, 60, 70])
+    line.add_stream('second', maxlen=3, values=[1, 2, 3])
+    line.render()
+    first.append(80)
+    svg = line.render()
+    assert redraws == [([1], True)]
+
+    full = Line(range=(0, 100))
+    full.uuid = line.uuid
+    full.add('static', [10, 20, 30])
+    full.add('first', [60, 70, 80])
+    full.add('second', [1, 2, 3])
+    assert svg == full.render()
+
+    # Options changed
+    line.title = 'Title'
+    assert b'Title' in line.render()
+    assert len(redraws) == 1
+
+    # Out of the box
+    line = Line()
+    stream = line.add_stream('stream', values=[1, 2, 3])
+    line.render()
+    stream.append(200)
+    assert b'200' in line.render()
+    assert redraws[-1] == ([0], False)
+
+
+def test_stream_redraw_changed_only(monkeypatch):
+    """Test that only the changed streams are prepared again"""
+    prepared = []
+    prepare_values = Line.prepare_values
+
+    def spy(self, raw, *args):
+        prepared.append([serie_kwargs['title'] for _, serie_kwargs in raw])
+        return prepare_values(self, raw, *args)
+
+    monkeypatch.setattr(Line, 'prepare_values', spy)
+    line = Line(range=(0, 100))
+    line.add('static', [10, 20, 30])
+    stream = line.add_stream('stream', maxlen=3, values=[1, 2, 3])
+    line.render()
+    assert line._stream_render is not None
+    del prepared[:]
+    stream.append(4)
+    line.render()
+    assert prepared == [['stream']]
+    # The previous rendering is not sent to worker processes
+    assert '_stream_render' not in load_chart(dump_chart(line)).__dict__
@@ -20,9 +20,54 @@
 
 from importlib_metadata import entry_points
 
+from pygal.etree import etree
+from pygal.graph.map import BaseMap, _templates
+
 # Load plugins tests
 for entry in entry_points(group="pygal.test.test_maps"):
     module = entry.load()
     for k, v in module.__dict__.items():
         if k.startswith('test_'):
             globals()['test_maps_' + entry.name + '_' + k[5:]] = v
+
+
+class Map(BaseMap):
+    """Minimal map with a duplicated area"""
+
+    svg_map = (
+        '<svg xmlns="http://www.w3.org/2000/svg"><g>%s</g></svg>' % ''.join(
+            '<g class="%s country map-element"><path d="M0 0"/></g>' % code
+            for code in ('fr', 'de', 'it', 'fr')
+        )
+    )
+    area_names = {'fr': 'France', 'de': 'Germany', 'it': 'Italy'}
+    area_prefix = ''
+    kind = 'country'
+
+
+def test_map_areas():
+    """Test map areas styling with metadata"""
+    map = Map()
+    map.add('a', [('fr', 10), {'value': ('de', 3), 'xlink': 'http://x'}])
+    map.add('b', [('fr', 1), ('it', 5)])
+    q = map.render_pyquery()
+    assert len(q('.fr.serie-0')) == 2
+    assert len(q('.fr.serie-1')) == 0
+    assert len(q('.it.serie-1')) == 1
+    assert len(q('a > .de.serie-0')) == 1
+    assert len(q('.de .map-area')) == 1
+
+
+def test_map_template():
+    """Test map templates are parsed once and left untouched"""
+    _templates.clear()
+    map = Map()
+    map.add('a', [{'value': ('fr', 10), 'xlink': 'http://x'}])
+    svg = map.render()
+    template, index = _templates[etree.lxml, Map.svg_map]
+    assert map.render() == svg
+    assert Map().render() != svg
+    assert list(_templates.values()) == [(template, index)]
+    assert _templates[etree.lxml, Map.svg_map][0] is template
+    assert index['fr country map-element'] == [(0, 0), (0, 3)]
+    assert 'serie-0' not in etree.tostring(template).decode('utf-8')
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Page rendering tests"""
+
+import re
+
+import pytest
+
+from pygal import Bar, Line, render_page
+from pygal.style import DarkStyle
+
+
+def test_render_page():
+    """Test charts with the same style share their css in a page"""
+    bar = Bar()
+    bar.add('1', [1, 2, 3])
+    line = Line()
+    line.add('2', [3, 1, 2])
+    dark = Bar(style=DarkStyle)
+    dark.add('3', [2])
+    page = render_page([bar, line, dark], title='Page & charts')
+    assert page.startswith('<!DOCTYPE html>')
+    assert '<title>Page &amp; charts</title>' in page
+    assert page.count('<style>') == 1
+    assert page.count('<svg') == 3
+    assert '<?xml' not in page
+
+    classes = re.findall(r'class="pygal-chart (pygal-shared-\w+)"', page)
+    assert len(classes) == 3
+    assert classes[0] == classes[1] != classes[2]
+    assert '.%s .title' % classes[0] in page
+    assert '.%s .title' % classes[2] in page
+    assert '#chart-' not in page.split('</style>')[0]
+    assert page.count('window.pygal.config[') == 3
+    assert page.count('<script src=') == 1
+
+
+def test_shared_assets():
+    """Test shared_assets option leave the css and js out of the chart"""
+    chart = Line(shared_assets=True)
+    chart.add('1', [1, 2])
+    svg = chart.render(is_unicode=True)
+    assert '<style' not in svg
+    assert '<script' not in svg
+    assert 'pygal-shared-' in svg
+
+
+def test_render_page_max_order():
+    """Test the shared css is the one of the chart with most series"""
+    small = Line()
+    small.add('1', [1])
+    big = Line()
+    for i in range(5):
+        big.add(str(i), [i])
+    page = render_page([small, big])
+    assert '.color-4' in page
+
+
+def test_render_page_forced_options():
+    """Test the options set by render_page can't be passed to it"""
+    chart = Line()
+    chart.add('1', [1, 2])
+    for option in ('no_prefix', 'disable_xml_declaration', 'shared_assets'):
+        with pytest.raises(TypeError):
+            render_page([chart], **{option: False})
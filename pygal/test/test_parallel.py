@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# This file is part of pygal
+#
+# A python svg graph plotting library
+# Copyright © 2012-2016 Kozea
+#
+# This library is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with pygal. If not, see <http://www.gnu.org/licenses/>.
+"""Parallel rendering tests"""
+
+import pytest
+
+from pygal import Bar, Line, parallel, render_many
+
+
+def _charts():
+    charts = []
+    for i in range(5):
+        chart = Line(title='Chart %d' % i)
+        chart.add('1', [i, 2 * i, 3])
+        charts.append(chart)
+    bar = Bar()
+    bar.x_labels = 'abc'
+    bar.add('2', [1, 2, 3])
+    charts.append(bar)
+    return charts
+
+
+def test_render_many_in_process():
+    """Test render_many on a small batch"""
+    charts = _charts()
+    assert render_many(charts) == [chart.render() for chart in charts]
+    assert render_many(charts, is_unicode=True, workers=1) == [
+        chart.render(is_unicode=True) for chart in charts
+    ]
+
+
+def test_render_many_pool():
+    """Test render_many in a process pool keeps the charts order"""
+    charts = _charts()
+    expected = [chart.render(pretty_print=True) for chart in charts]
+    assert render_many(
+        charts, workers=2, chunksize=2, min_batch=0, pretty_print=True
+    ) == expected
+
+
+def test_render_many_files(tmpdir):
+    """Test render_many writing files"""
+    charts = _charts()
+    filenames = [str(tmpdir.join('%d.svg' % i)) for i in range(len(charts))]
+    assert render_many(
+        charts, workers=2, min_batch=0, filenames=filenames
+    ) is None
+    for chart, filename in zip(charts, filenames):
+        with open(filename, encoding='utf-8') as f:
+            assert f.read() == chart.render(is_unicode=True)
+
+    with pytest.raises(ValueError):
+        render_many(charts, filenames=filenames[1:])
+
+
+def test_render_many_lambda(monkeypatch):
+    """Test lambdas in charts are sent with cloudpickle"""
+    chart = Line(value_formatter=lambda x: '<%s>' % x)
+    chart.add('1', [1, 2])
+    pytest.importorskip('cloudpickle')
+    assert render_many(
+        [chart, chart], workers=2, min_batch=0
+    ) == [chart.render()] * 2
+
+    monkeypatch.setattr(parallel, 'cloudpickle', None)
+    with pytest.raises(ValueError) as e:
+        parallel.dump_chart(chart)
+    assert 'Line' in str(e.value)
+    assert render_many([chart], workers=2) == [chart.render()]
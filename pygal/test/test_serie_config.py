@@ -18,7 +18,11 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Test per serie configuration"""
 
+from array import array
+
 from pygal import Line
+from pygal.config import SerieConfig
+from pygal.serie import Points, Serie
 
 s1 = [1, 3, 12, 3, 4]
 s2 = [7, -4, 10, None, 8, 3, 1]
@@ -70,3 +74,28 @@ def test_serie_precedence_over_global_config():
     assert len(q('.serie-1 .line')) == 0
     assert len(q('.serie-0 .dot')) == 5
     assert len(q('.serie-1 .dot')) == 6
+
+
+def test_serie_options():
+    """Test that serie options are read from its config"""
+    config = SerieConfig()
+    config(stroke=False, title='1')
+    serie = Serie(0, s2, config)
+    assert not hasattr(serie, '__dict__')
+    assert serie.title == '1'
+    assert serie.stroke is False
+    assert serie.fill is False
+    assert serie.safe_values == [7, -4, 10, 8, 3, 1]
+
+
+def test_points():
+    """Test points built from shared x positions"""
+    x = array('d', [0, .25, .5, .75, 1])
+    points = Points(x, s1)
+    assert len(points) == 5
+    assert points[1] == (.25, 3)
+    assert points[-1] == (1., 4)
+    assert points[1:3] == [(.25, 3), (.5, 12)]
+    assert points == list(zip(x, s1))
+    assert Points(x, s1[:2]) == [(0., 1), (.25, 3)]
+    assert Points.from_pairs([(0, 1), (1, 2)]).y == array('d', [1, 2])
@@ -18,6 +18,10 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """Style related tests"""
 
+import os
+import time
+import uuid
+
 from pygal import Line
 from pygal.style import (
     DarkenStyle,
@@ -26,7 +30,9 @@ from pygal.style import (
     LightStyle,
     RotateStyle,
     SaturateStyle,
+    Style,
 )
+from pygal.svg import css_cache, get_style_key
 
 STYLES = LightenStyle, DarkenStyle, SaturateStyle, DesaturateStyle, RotateStyle
 
@@ -51,3 +57,53 @@ def test_parametric_styles_with_parameters():
     line.add('_', [1, 2, 3])
     line.x_labels = 'abc'
     assert line.render()
+
+
+def test_css_cache():
+    """Test that css is cached and shared between charts"""
+    css_cache.clear()
+    line = Line()
+    line.add('_', [1, 2, 3])
+    svg = line.render()
+    misses = css_cache.misses
+    assert misses
+    assert line.render() == svg
+    other = Line()
+    other.add('_', [1, 2, 3])
+    other_svg = other.render()
+    assert css_cache.misses == misses
+    assert css_cache.hits
+    assert other_svg == svg.replace(
+        line.uuid.encode('utf-8'), other.uuid.encode('utf-8')
+    )
+    assert b'\x00' not in other_svg
+    css_cache.clear()
+    assert len(css_cache) == 0
+    assert line.render() == svg
+
+
+def test_css_cache_style_values():
+    """Test that styles with different values don't share css"""
+    assert get_style_key(Style()) == get_style_key(Style())
+    assert get_style_key(Style()) != get_style_key(Style(background='red'))
+    line = Line(no_prefix=True)
+    line.add('_', [1, 2, 3])
+    svg = line.render()
+    line.style = Style(background='red')
+    assert line.render() != svg
+
+
+def test_css_cache_file_mtime():
+    """Test that changed css files are templated again"""
+    file_name = '/tmp/test_style-%s.css' % uuid.uuid4()
+    with open(file_name, 'w') as f:
+        f.write('{{ id }}.a { fill: blue; }')
+    line = Line(css=('file://' + file_name, ))
+    line.add('_', [1, 2, 3])
+    assert b'.a{fill:blue}' in line.render()
+    with open(file_name, 'w') as f:
+        f.write('{{ id }}.a { fill: green; }')
+    mtime = time.time() + 10
+    os.utime(file_name, (mtime, mtime))
+    assert b'.a{fill:green}' in line.render()
+    os.remove(file_name)
@@ -22,12 +22,17 @@
 from pytest import raises
 
 from pygal.util import (
+    LRUCache,
     _swap_curly,
+    compute_scale,
     majorize,
     mergextend,
     minify_css,
+    number_format,
+    relative_path,
     round_to_float,
     round_to_int,
+    scale_cache,
     template,
     truncate,
 )
@@ -54,6 +59,29 @@ def test_round_to_float():
     assert round_to_float(12.1134, .00001) == 12.1134
     assert round_to_float(12.1934, .5) == 12.0
     assert round_to_float(12.2934, .5) == 12.5
+    assert round_to_float(3.14159, 1e-7) == 3.1415900
+    assert round_to_float(.7, .1) == .7
+    assert round_to_float(-.7, .1) == -.7
+
+
+def test_compute_scale():
+    """Test scales are cached and returned as new lists"""
+    scale_cache.clear()
+    scale = compute_scale(0, 1, False, None, 4, 16)
+    assert scale == [0, .1, .2, .3, .4, .5, .6, .7, .8, .9, 1]
+    scale.append(2)
+    assert compute_scale(0, 1, False, None, 4, 16) == scale[:-1]
+    assert (scale_cache.hits, scale_cache.misses) == (1, 1)
+    assert compute_scale(1, 1000, True, None, 4, 16) == [
+        1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 40, 50, 60, 70, 80, 90,
+        100, 200, 300, 400, 500, 600, 700, 800, 900, 1000
+    ]
+    assert compute_scale(1, 1000, False, None, 4, 16)[:2] == [100, 200]
+    assert str(compute_scale(-0., 1e-3, False, 2, 4, 16)[0]) == '-0.0'
+    assert str(compute_scale(0., 1e-3, False, 2, 4, 16)[0]) == '0.0'
+    # Cached major values are taken from the given values
+    assert majorize((0, 1, 2, 3, 4, 5)) == [0, 5]
+    assert list(map(type, majorize((0., 1, 2, 3, 4, 5.)))) == [float, float]
 
 
 def test_swap_curly():
@@ -172,3 +200,42 @@ def test_mergextend():
                       ['c', 'd']) == ['a', 'c', 'd', 'b']
 
     assert mergextend(['a', ..., 'b'], ['c', 'd']) == ['a', 'c', 'd', 'b']
+
+
+def test_lru_cache():
+    """Test the bounded cache"""
+    cache = LRUCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1
+    cache['c'] = 3
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_number_format():
+    """Test number format function"""
+    assert number_format(1.23456, 2) == '1.23'
+    assert number_format(1.2, 3) == '1.2'
+    assert number_format(2.0001, 2) == '2'
+    assert number_format(-0.001, 2) == '0'
+    assert number_format(100, 0) == '100'
+
+
+def test_relative_path():
+    """Test relative path encoding"""
+    assert relative_path([(1, 2)], 1) == '1 2'
+    assert relative_path([(1, 2), (3, 1), (3.5, 4)],
+                         1) == '1 2l2-1 0.5 3'
+    assert relative_path([(.1, .2), (.4, .1)]) == '0.1 0.2l0.3-0.1'
+    # Rounding errors don't add up
+    coords = [(i * 1.004, 0) for i in range(1000)]
+    path = relative_path(coords, 2)
+    x = sum(float(d) for d in path.split('l')[1].split()[::2])
+    assert round(x, 2) == round(999 * 1.004, 2)
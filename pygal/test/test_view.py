@@ -18,7 +18,7 @@
 # along with pygal. If not, see <http://www.gnu.org/licenses/>.
 """View related tests"""
 
-# TODO
+from pygal.view import Box, View
 
 
 def test_all_logarithmic(Chart):
@@ -27,3 +27,26 @@ def test_all_logarithmic(Chart):
     chart.add('1', [1, 30, 8, 199, -23])
     chart.add('2', [87, 42, .9, 189, 81])
     assert chart.render()
+
+
+def test_clip():
+    """Test Cohen–Sutherland line clipping"""
+    view = View(10, 10, Box())
+    assert view.clip([(1, 1), (2, 2)]) == [[(1, 1), (2, 2)]]
+    assert view.clip([(20, 20), (30, 30)]) == []
+    assert view.clip([(-5, 5), (15, 5)]) == [[(0, 5), (10, 5)]]
+    assert view.clip([(1, 1), (5, 5), (15, 5), (15, 8), (5, 8), (5, -5)]) == [
+        [(1, 1), (5, 5), (10, 5)], [(10, 8), (5, 8), (5, 0)]
+    ]
+
+
+def test_clip_polygon():
+    """Test Sutherland–Hodgman polygon clipping"""
+    view = View(10, 10, Box())
+    assert view.clip_polygon([(1, 1), (5, 1), (5, 5)]) == [
+        (1, 1), (5, 1), (5, 5)
+    ]
+    assert sorted(set(view.clip_polygon([(-5, 5), (5, 5), (5, 15)]))) == [
+        (0, 5), (0, 10), (5, 5), (5, 10)
+    ]
+    assert view.clip_polygon([(20, 20), (30, 20), (30, 30)]) == []
@@ -21,9 +21,10 @@
 from __future__ import division
 
 import re
-import pandas as pd
-from decimal import Decimal
+import zlib
+from collections import OrderedDict
 from math import ceil, cos, floor, log10, pi, sin
+from threading import Lock
 
 
 def float_format(number):
@@ -33,11 +34,22 @@ def float_format(number):
 
 def majorize(values):
     """Filter sequence to return only major considered numbers"""
-    sorted_values = sorted(values)
+    values = tuple(values)
+    key = 'major', values
+    indexes = scale_cache.get(key)
+    if indexes is None:
+        indexes = scale_cache[key] = _major_indexes(values)
+    return [values[i] for i in indexes]
+
+
+def _major_indexes(values):
+    """Get the indexes of the major values in sorted order, see majorize"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    sorted_values = [values[i] for i in order]
     if len(values) <= 3 or (
             abs(2 * sorted_values[1] - sorted_values[0] - sorted_values[2]) >
             abs(1.5 * (sorted_values[1] - sorted_values[0]))):
-        return []
+        return ()
     values_step = sorted_values[1] - sorted_values[0]
     full_range = sorted_values[-1] - sorted_values[0]
     step = 10**int(log10(full_range))
@@ -54,7 +66,7 @@ def majorize(values):
     major_values = [
         value for value in values if value / step == round(value / step)
     ]
-    return [value for value in sorted_values if value in major_values]
+    return tuple(i for i in order if values[i] in major_values)
 
 
 def round_to_int(number, precision):
@@ -64,11 +76,25 @@ def round_to_int(number, precision):
     return rounded
 
 
+def _decimal_parts(number):
+    """
+    Get the integer mantissa and the power of ten exponent
+    of the shortest decimal representation of a number
+    """
+    mantissa, _, exponent = str(number).partition('e')
+    integer, _, fraction = mantissa.partition('.')
+    return int(integer + fraction), int(exponent or 0) - len(fraction)
+
+
 def round_to_float(number, precision):
     """Round a float to a precision"""
-    rounded = Decimal(str(floor((number + precision / 2) // precision))
-                      ) * Decimal(str(precision))
-    return float(rounded)
+    # The multiple of the decimal precision is computed exactly on integers
+    # then the int division gives the nearest float
+    mantissa, exponent = _decimal_parts(precision)
+    rounded = floor((number + precision / 2) // precision) * mantissa
+    if exponent >= 0:
+        return float(rounded * 10**exponent)
+    return rounded / 10**-exponent
 
 
 def round_to_scale(number, precision):
@@ -141,6 +167,22 @@ def compute_logarithmic_scale(min_, max_, min_scale, max_scale):
 
 def compute_scale(min_, max_, logarithmic, order_min, min_scale, max_scale):
     """Compute an optimal scale between min and max"""
+    key = (
+        type(min_), min_, type(max_), max_,
+        logarithmic, order_min, min_scale, max_scale,
+        # Tell -0. from 0. as min and max can be returned as is
+        min_ == 0 and str(min_), max_ == 0 and str(max_)
+    )
+    positions = scale_cache.get(key)
+    if positions is None:
+        positions = scale_cache[key] = tuple(_compute_scale(
+            min_, max_, logarithmic, order_min, min_scale, max_scale
+        ))
+    return list(positions)
+
+
+def _compute_scale(min_, max_, logarithmic, order_min, min_scale, max_scale):
+    """Compute the scale positions, see compute_scale"""
     if min_ == 0 and max_ == 0:
         return [0]
     if max_ - min_ == 0:
@@ -254,18 +296,73 @@ class cached_property(object):
     def __get__(self, obj, type_=None):
         """
         Get descriptor calling the property function and replacing it with
-        its value or on state if we are in the transient state.
+        its value (in the state when rendering a chart).
         """
         if obj is None:
             return self
-        value = self.getter(obj)
-        if hasattr(obj, 'state'):
-            setattr(obj.state, self.__name__, value)
-        else:
-            obj.__dict__[self.__name__] = self.getter(obj)
+        value = obj.__dict__[self.__name__] = self.getter(obj)
         return value
 
 
+def gzip_iter(chunks, compresslevel=zlib.Z_DEFAULT_COMPRESSION):
+    """Gzip compress the given bytes chunks as they come"""
+    # 16 + MAX_WBITS writes a gzip header and trailer
+    compressor = zlib.compressobj(
+        compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+    )
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class LRUCache(object):
+    """Bounded mapping forgetting the least recently used entries"""
+
+    def __init__(self, maxsize=128):
+        """Create an empty cache holding at most maxsize entries"""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """Get the cached value for key, counting hits and misses"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        """Cache value for key, dropping the oldest entry if full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        """Number of cached entries"""
+        return len(self._data)
+
+    def clear(self):
+        """Empty the cache and reset its statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Scales and major values of the last rendered ranges
+scale_cache = LRUCache(512)
+
 css_comments = re.compile(r'/\*.*?\*/', re.MULTILINE | re.DOTALL)
 
 
@@ -345,16 +442,56 @@ def coord_diff(x, y):
     return (x[0] - y[0], x[1] - y[1])
 
 
-def coord_format(x):
-    return '%f %f' % x
+def number_format(number, precision):
+    """Format a number with precision decimals without trailing zeroes"""
+    string = '%.*f' % (precision, number)
+    if '.' in string:
+        string = string.rstrip('0').rstrip('.')
+    if string == '-0':
+        return '0'
+    return string
+
 
+def coord_format(x, precision=None):
+    if precision is None:
+        return '%f %f' % x
+    return '%.*f %.*f' % (precision, x[0], precision, x[1])
 
-def coord_dual(r):
-    return coord_format((r, r))
 
+def coord_dual(r, precision=None):
+    return coord_format((r, r), precision)
 
-def coord_abs_project(center, rho, theta):
-    return coord_format(coord_diff(center, coord_project(rho, theta)))
+
+def coord_abs_project(center, rho, theta, precision=None):
+    return coord_format(
+        coord_diff(center, coord_project(rho, theta)), precision
+    )
+
+
+def relative_path(coords, precision=None):
+    """
+    Encode the coords of a line as a relative path: 'x y l dx dy dx dy…'.
+    Deltas are computed between rounded coordinates so that rounding
+    errors don't add up.
+    """
+    if precision is None:
+        precision = 6
+
+    def fmt(x, y):
+        return '%s %s' % (
+            number_format(x, precision), number_format(y, precision)
+        )
+
+    coords = [(round(x, precision), round(y, precision)) for x, y in coords]
+    path = [fmt(*coords[0])]
+    if len(coords) > 1:
+        path.append('l')
+        path.append(' '.join([
+            fmt(x - x0, y - y0)
+            for (x0, y0), (x, y) in zip(coords, coords[1:])
+        ]))
+    # Negative numbers don't need a separator
+    return ''.join(path).replace(' -', '-')
 
 
 def mergextend(list1, list2):
@@ -364,9 +501,23 @@ def mergextend(list1, list2):
     return list(list1[:index]) + list(list2) + list(list1[index + 1:])
 
 
+_list_keys = None
+
+
+def list_keys():
+    """Names of the list config keys"""
+    global _list_keys
+    if _list_keys is None:
+        from pygal.config import CONFIG_ITEMS
+        _list_keys = frozenset(
+            item.name for item in CONFIG_ITEMS if item.type == list
+        )
+    return _list_keys
+
+
 def merge(dict1, dict2):
-    from pygal.config import CONFIG_ITEMS, Key
-    _list_items = [item.name for item in CONFIG_ITEMS if item.type == list]
+    from pygal.config import Key
+    _list_items = list_keys()
     for key, val in dict2.items():
         if isinstance(val, Key):
             val = val.value
@@ -377,6 +528,8 @@ def merge(dict1, dict2):
             dict1[key] = val
 
 def create_bar_chart_from_csv(file_path, title, columns, x_labels_range):
+    import pandas as pd
+
     # Reading and type casting columns in our csv file.
     data_frame = pd.read_csv(file_path, dtype={col: float if col != 'Date' else str for col in columns})
     
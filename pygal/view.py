@@ -26,6 +26,8 @@ from math import cos, log10, pi, sin
 class Margin(object):
     """Class reprensenting a margin (top, right, left, bottom)"""
 
+    __slots__ = ('top', 'right', 'bottom', 'left')
+
     def __init__(self, top, right, bottom, left):
         """Create the margin object from the top, right, left, bottom margin"""
         self.top = top
@@ -47,6 +49,10 @@ class Margin(object):
 class Box(object):
     """Chart boundings"""
 
+    __slots__ = (
+        '_xmin', '_ymin', '_xmax', '_ymax', '_rmin', '_rmax', '_tmin', '_tmax'
+    )
+
     margin = .02
 
     def __init__(self, xmin=0, ymin=0, xmax=1, ymax=1):
@@ -146,6 +152,8 @@ class Box(object):
 class View(object):
     """Projection base class"""
 
+    __slots__ = ('width', 'height', 'box')
+
     def __init__(self, width, height, box):
         """Create the view with a width an height and a box bounds"""
         self.width = width
@@ -172,10 +180,103 @@ class View(object):
         x, y = xy
         return (self.x(x), self.y(y))
 
+    def _outcode(self, x, y):
+        """Cohen–Sutherland region code of a projected point"""
+        code = 0
+        if x < 0:
+            code |= 1
+        elif x > self.width:
+            code |= 2
+        if y < 0:
+            code |= 4
+        elif y > self.height:
+            code |= 8
+        return code
+
+    def contains(self, x, y):
+        """Tell if the projected point is in the view"""
+        return 0 <= x <= self.width and 0 <= y <= self.height
+
+    def clip(self, coords):
+        """
+        Clip a projected line to the view with the Cohen–Sutherland
+        algorithm and return the list of its visible parts
+        """
+        outcode = self._outcode
+        width, height = self.width, self.height
+        codes = [outcode(x, y) for x, y in coords]
+        if not any(codes):
+            return [coords]
+        if len(coords) == 1:
+            return []
+
+        sequences = []
+        current = []
+        for i in range(len(coords) - 1):
+            (x0, y0), (x1, y1) = coords[i], coords[i + 1]
+            c0, c1 = codes[i], codes[i + 1]
+            while c0 | c1:
+                if c0 & c1:
+                    break
+                c = c0 or c1
+                if c & 8:
+                    x, y = x0 + (x1 - x0) * (height - y0) / (y1 - y0), height
+                elif c & 4:
+                    x, y = x0 + (x1 - x0) * -y0 / (y1 - y0), 0
+                elif c & 2:
+                    x, y = width, y0 + (y1 - y0) * (width - x0) / (x1 - x0)
+                else:
+                    x, y = 0, y0 + (y1 - y0) * -x0 / (x1 - x0)
+                if c == c0:
+                    x0, y0 = x, y
+                    c0 = outcode(x, y)
+                else:
+                    x1, y1 = x, y
+                    c1 = outcode(x, y)
+            else:
+                if not current or current[-1] != (x0, y0):
+                    if current:
+                        sequences.append(current)
+                    current = [(x0, y0)]
+                current.append((x1, y1))
+        if current:
+            sequences.append(current)
+        return sequences
+
+    def clip_polygon(self, coords):
+        """
+        Clip a projected polygon to the view with the
+        Sutherland–Hodgman algorithm
+        """
+
+        def cut(p, q, axis, value):
+            t = (value - p[axis]) / (q[axis] - p[axis])
+            return (p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1]))
+
+        # (axis, bound, side) of the four view edges
+        for axis, bound, side in ((0, 0, 1), (0, self.width, -1),
+                                  (1, 0, 1), (1, self.height, -1)):
+            if not coords:
+                break
+            clipped = []
+            previous = coords[-1]
+            previous_in = side * (previous[axis] - bound) >= 0
+            for point in coords:
+                point_in = side * (point[axis] - bound) >= 0
+                if point_in != previous_in:
+                    clipped.append(cut(previous, point, axis, bound))
+                if point_in:
+                    clipped.append(point)
+                previous, previous_in = point, point_in
+            coords = clipped
+        return coords
+
 
 class ReverseView(View):
     """Same as view but reversed vertically"""
 
+    __slots__ = ()
+
     def y(self, y):
         """Project reversed y"""
         if y is None:
@@ -321,6 +422,8 @@ class ReverseView(View):
 class LogView(View):
     """Y Logarithmic projection"""
 
+    __slots__ = ('log10_ymax', 'log10_ymin')
+
     # Do not want to call the parent here
     def __init__(self, width, height, box):
         """Create the view with a width an height and a box bounds"""
@@ -346,6 +449,8 @@ class LogView(View):
 class XLogView(View):
     """X logarithmic projection"""
 
+    __slots__ = ('log10_xmax', 'log10_xmin')
+
     # Do not want to call the parent here
     def __init__(self, width, height, box):
         """Create the view with a width an height and a box bounds"""
@@ -366,9 +471,14 @@ class XLogView(View):
         )
 
 
-class XYLogView(XLogView, LogView):
+class XYLogView(XLogView):
     """X and Y logarithmic projection"""
 
+    # Slots of both log views can't be inherited at once
+    __slots__ = ('log10_ymax', 'log10_ymin')
+
+    y = LogView.y
+
     def __init__(self, width, height, box):
         """Create the view with a width an height and a box bounds"""
         self.width = width